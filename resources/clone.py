@@ -45,24 +45,36 @@ Logging:
         - clone.create (INFO): Clone created successfully
         - clone.fail (ERROR): Clone creation failed
         - clone.register_fail (WARNING): Addon re-registration failed
+        - clone.scan_timeout (WARNING): New clone not found before addon scan timeout
 """
 
+import json
 import os
 import shutil
 import sys
 from typing import Optional
 from xml.etree import ElementTree as et
+from xml.sax.saxutils import escape
 
 import xbmc
 import xbmcaddon
 import xbmcgui
 import xbmcvfs
 
-from resources.lib.constants import ADDON_ENABLE_DELAY_MS
+from resources.lib.constants import (
+    ADDON_ENABLE_DELAY_MS,
+    ADDON_SCAN_POLL_BACKOFF_MS,
+    ADDON_SCAN_TIMEOUT_MS,
+)
 from resources.lib.ui.dialogs import show_confirm
 
 # Import shared utilities
-from resources.lib.utils import get_logger, lang, restart_addon, sanitize_filename
+from resources.lib.utils import (
+    get_logger,
+    lang,
+    restart_addon,
+    sanitize_filename,
+)
 
 
 def _replace_in_file(filepath, replacements):
@@ -71,18 +83,154 @@ def _replace_in_file(filepath, replacements):
     
     Uses read-then-write instead of fileinput.input(inplace=True) to avoid
     encoding failures on systems where the locale defaults to ASCII
-    (e.g. SteamOS/Arch with POSIX locale).
+    (e.g. SteamOS/Arch with POSIX locale). The file is handled as bytes
+    with UTF-8 encoded replacements, so it is never decoded and its line
+    endings are kept as-is. Files with nothing to replace are left untouched.
     
     Args:
         filepath: Path to the file to modify.
         replacements: List of (old, new) tuples to apply in order.
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    with open(filepath, 'rb') as f:
+        original = f.read()
+    content = original
     for old, new in replacements:
-        content = content.replace(old, new)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+        content = content.replace(old.encode('utf-8'), new.encode('utf-8'))
+    if content != original:
+        with open(filepath, 'wb') as f:
+            f.write(content)
+
+
+# Entries skipped when copying the addon tree into a clone
+_IGNORE_NAMES = frozenset(('CVS', '.git', 'tmp', '.svn', '__pycache__'))
+_IGNORE_SUFFIXES = ('.pyc', '.pyo')
+
+
+def _copy_ignore(src, names):
+    """shutil.copytree ignore callback: one set/suffix check per entry."""
+    return [n for n in names if n in _IGNORE_NAMES or n.endswith(_IGNORE_SUFFIXES)]
+
+
+# Files a clone drops or replaces with its own template, by directory
+# relative to the addon root; they are not copied in the first place
+_CLONE_SKIP_FILES = (
+    ('', frozenset(('service.py', 'addon.xml'))),
+    ('resources', frozenset(('settings.xml', 'clone.py'))),
+)
+
+
+def _make_clone_ignore(root):
+    """
+    Build a copytree ignore callback for copying the addon at root.
+    
+    Skips everything _copy_ignore does plus the files listed in
+    _CLONE_SKIP_FILES, so they are never copied only to be deleted.
+    
+    Args:
+        root: The source path passed to shutil.copytree.
+    
+    Returns:
+        An ignore callback for shutil.copytree.
+    """
+    skip_by_dir = {
+        (os.path.join(root, sub) if sub else root): files
+        for sub, files in _CLONE_SKIP_FILES
+    }
+
+    def ignore(src, names):
+        ignored = _copy_ignore(src, names)
+        skip = skip_by_dir.get(src)
+        if skip:
+            ignored.extend(n for n in names if n in skip)
+        return ignored
+    return ignore
+
+
+# Placeholders in resources/addon_clone.xml, filled in by _fill_addon_xml
+_ADDON_XML_ID = b'script.easytv.SANNAME'
+_ADDON_XML_NAME = b'CLONENAME'
+_ADDON_XML_SUMMARY = b'COMBNAME'
+_ADDON_XML_VERSION = b'version="1.0.0"'
+
+
+def _fill_addon_xml(filepath, addon_id, name, version):
+    """
+    Fill the clone addon.xml template with the clone's id, name and version.
+    
+    The template has a fixed layout, so the placeholders are substituted as
+    bytes in one read/write (like _replace_in_file). Falls back to an
+    ElementTree rewrite if any placeholder is missing (e.g. a hand-edited
+    template).
+    
+    Args:
+        filepath: Path to the addon.xml copied from addon_clone.xml.
+        addon_id: The clone's addon ID.
+        name: The clone's display name (XML-escaped here).
+        version: Version string inherited from the parent addon.
+    """
+    with open(filepath, 'rb') as f:
+        content = f.read()
+    placeholders = (_ADDON_XML_ID, _ADDON_XML_NAME, _ADDON_XML_SUMMARY, _ADDON_XML_VERSION)
+    if all(p in content for p in placeholders):
+        safe_name = escape(name, {'"': '&quot;'}).encode('utf-8')
+        content = (content
+                   .replace(_ADDON_XML_ID, addon_id.encode('utf-8'))
+                   .replace(_ADDON_XML_NAME, safe_name)
+                   .replace(_ADDON_XML_SUMMARY, safe_name)
+                   .replace(_ADDON_XML_VERSION, f'version="{version}"'.encode('utf-8')))
+        with open(filepath, 'wb') as f:
+            f.write(content)
+        return
+
+    tree = et.parse(filepath)
+    root = tree.getroot()
+    root.set('id', addon_id)
+    root.set('name', name)
+    root.set('version', version)
+    summary_elem = tree.find('.//summary')
+    if summary_elem is not None:
+        summary_elem.text = name
+    tree.write(filepath)
+
+
+# Addons.GetAddonDetails request; fill with the JSON-encoded addon ID.
+# Serialized once per wait instead of once per poll.
+_ADDON_DETAILS_RPC = (
+    '{"jsonrpc":"2.0","method":"Addons.GetAddonDetails",'
+    '"id":1,"params":{"addonid":%s}}'
+)
+
+
+def _wait_for_addon(addon_id):
+    """
+    Wait until Kodi's addon database knows addon_id, after UpdateLocalAddons.
+    
+    Polls Addons.GetAddonDetails with escalating sleeps and gives up after
+    ADDON_SCAN_TIMEOUT_MS, so a slow scan never waits longer than the fixed
+    sleep this replaced.
+    
+    Args:
+        addon_id: The addon ID to look for.
+    
+    Returns:
+        True if the addon was found, False on timeout.
+    """
+    request = _ADDON_DETAILS_RPC % json.dumps(addon_id)
+    waited = 0
+    step = 0
+    while waited < ADDON_SCAN_TIMEOUT_MS:
+        sleep_ms = min(ADDON_SCAN_POLL_BACKOFF_MS[min(step, len(ADDON_SCAN_POLL_BACKOFF_MS) - 1)],
+                       ADDON_SCAN_TIMEOUT_MS - waited)
+        xbmc.sleep(sleep_ms)
+        waited += sleep_ms
+        step += 1
+        try:
+            response = json.loads(xbmc.executeJSONRPC(request))
+        except ValueError:
+            continue
+        if response.get('result', {}).get('addon'):
+            return True
+    return False
 
 
 __addon__        = xbmcaddon.Addon('script.easytv')
@@ -90,6 +238,7 @@ __addonid__      = __addon__.getAddonInfo('id')
 __setting__      = __addon__.getSetting
 dialog           = xbmcgui.Dialog()
 scriptPath       = __addon__.getAddonInfo('path')
+addon_version    = __addon__.getAddonInfo('version')
 addon_path       = xbmcvfs.translatePath('special://home/addons')
 log              = get_logger('clone')
 
@@ -132,8 +281,8 @@ def Main():
     san_name = 'script.easytv.' + sanitized_suffix
     new_path = os.path.join(addon_path, san_name)
     
-    # Get parent version to use for clone
-    parent_version = __addon__.getAddonInfo('version')
+    # Clone inherits the parent version
+    parent_version = addon_version
 
     log.debug("Clone parameters", clone_name=clone_name, san_name=san_name, 
               new_path=new_path, script_path=scriptPath, parent_version=parent_version)
@@ -165,14 +314,14 @@ def Main():
     progress = xbmcgui.DialogProgress()
     progress.create("EasyTV", "Creating clone...")
     try:
-        # Clean up any leftover temp folder
-        if os.path.isdir(temp_path):
-            shutil.rmtree(temp_path, ignore_errors=True)
+        # Clean up any leftover temp folder (ignore_errors also covers a
+        # missing folder, so no separate isdir check is needed)
+        shutil.rmtree(temp_path, ignore_errors=True)
 
         progress.update(10, "Copying addon files...")
         # copy current addon to temp location first
-        IGNORE_PATTERNS = ('.pyc','CVS','.git','tmp','.svn','__pycache__')
-        shutil.copytree(scriptPath, temp_path, ignore=shutil.ignore_patterns(*IGNORE_PATTERNS))
+        # (service.py, clone.py and the main addon.xml/settings.xml are skipped)
+        shutil.copytree(scriptPath, temp_path, ignore=_make_clone_ignore(scriptPath))
 
         # Ensure clone starts with default icon (not main addon's custom icon)
         default_icon = os.path.join(temp_path, 'icon_default.png')
@@ -180,16 +329,9 @@ def Main():
             shutil.copy2(default_icon, os.path.join(temp_path, 'icon.png'))
 
         progress.update(25, "Configuring clone...")
-        # remove the unneeded files
         addon_file = os.path.join(temp_path,'addon.xml')
 
-        os.remove(os.path.join(temp_path,'service.py'))
-        os.remove(addon_file)
-        #os.remove(os.path.join(temp_path,'resources','selector.py'))
-        os.remove(os.path.join(temp_path,'resources','settings.xml'))
-        os.remove(os.path.join(temp_path,'resources','clone.py'))
-
-        # replace the settings file and addon file with the truncated one
+        # install the truncated settings file and addon file
         shutil.move( os.path.join(temp_path,'resources','addon_clone.xml') , addon_file )
         shutil.move( os.path.join(temp_path,'resources','settings_clone.xml') , os.path.join(temp_path,'resources','settings.xml') )
 
@@ -205,25 +347,21 @@ def Main():
         # Without this, Kodi 21+ won't load language strings for the clone
         # This handles future Weblate translations (multiple language folders)
         language_dir = os.path.join(temp_path, 'resources', 'language')
-        for lang_folder in os.listdir(language_dir):
-            strings_file = os.path.join(language_dir, lang_folder, 'strings.po')
-            if os.path.isfile(strings_file):
-                _replace_in_file(strings_file, [
-                    ('# Addon Name: EasyTV', f'# Addon Name: {clone_name}'),
-                    ('# Addon id: script.easytv', f'# Addon id: {san_name}'),
-                ])
+        # scandir's is_dir() comes from the directory listing, so stray files
+        # in language/ are skipped without a stat of their own
+        with os.scandir(language_dir) as entries:
+            for entry in entries:
+                strings_file = os.path.join(entry.path, 'strings.po')
+                if entry.is_dir() and os.path.isfile(strings_file):
+                    _replace_in_file(strings_file, [
+                        ('# Addon Name: EasyTV', f'# Addon Name: {clone_name}'),
+                        ('# Addon id: script.easytv', f'# Addon id: {san_name}'),
+                    ])
 
         progress.update(55, "Updating addon metadata...")
         # edit the addon.xml to set clone id, name, and version
-        tree = et.parse(addon_file)
-        root = tree.getroot()
-        root.set('id', san_name)
-        root.set('name', clone_name)
-        root.set('version', parent_version)  # Clone inherits parent version
-        summary_elem = tree.find('.//summary')
-        if summary_elem is not None:
-            summary_elem.text = clone_name
-        tree.write(addon_file)
+        # (clone inherits parent version)
+        _fill_addon_xml(addon_file, san_name, clone_name, parent_version)
 
         progress.update(65, "Updating scripts...")
         # replace the id on these files, avoids Access Violation
@@ -264,8 +402,7 @@ def Main():
     except Exception as e:
         _, _, tb = sys.exc_info()  # Only need traceback
         # Clean up temp folder on error
-        if os.path.isdir(temp_path):
-            shutil.rmtree(temp_path, ignore_errors=True)
+        shutil.rmtree(temp_path, ignore_errors=True)
         progress.close()  # Close dialog before error dialog
         errorHandle(e, tb, new_path)
 
@@ -274,8 +411,11 @@ def Main():
         progress.update(90, "Registering with Kodi...")
         # First, tell Kodi to rescan the addons directory
         xbmc.executebuiltin('UpdateLocalAddons')
-        # Give Kodi time to fully scan - this can take a few seconds on large libraries
-        xbmc.sleep(3000)
+        # Wait for the scan to pick up the clone - this can take a few seconds
+        # on large libraries, but usually finishes much sooner
+        if not _wait_for_addon(san_name):
+            log.warning("Clone not visible after addon scan", event="clone.scan_timeout",
+                        addon_id=san_name)
         
         progress.update(95, "Enabling clone...")
         # Now enable the newly discovered addon
@@ -44,15 +44,19 @@ def _fetch_all_shows() -> List[Tuple[str, int, str]]:
     if _cached_shows is not None:
         return _cached_shows
 
-    from resources.lib.data.queries import build_shows_art_query, get_all_shows_query
-    from resources.lib.utils import json_query
+    from resources.lib.data.queries import (
+        build_jsonrpc_batch,
+        build_shows_art_query,
+        get_all_shows_query,
+    )
+    from resources.lib.utils import json_query_batch
 
-    # Get all shows
-    result = json_query(get_all_shows_query())
+    # Get all shows and their art in one round-trip
+    result, art_result = json_query_batch(build_jsonrpc_batch([
+        get_all_shows_query(),
+        build_shows_art_query(),
+    ]))
     shows = result.get("tvshows", [])
-
-    # Get art for all shows
-    art_result = json_query(build_shows_art_query())
     art_shows = art_result.get("tvshows", [])
     art_map: Dict[int, str] = {}
     for s in art_shows:
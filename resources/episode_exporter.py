@@ -19,7 +19,6 @@ Logging:
         - export.file_fail (WARNING): Individual file export failed
 """
 
-import ast
 import json
 import os
 import shutil
@@ -39,14 +38,17 @@ from resources.lib.constants import (
 from resources.lib.ui.dialogs import show_confirm, show_select
 
 # Import shared utilities
-from resources.lib.utils import get_bool_setting, get_logger, json_query, lang
+from resources.lib.utils import (
+	get_bool_setting,
+	get_logger,
+	json_query,
+	lang,
+	parse_show_id_list,
+)
 
 __addon__        = xbmcaddon.Addon('script.easytv')
-__addonid__      = __addon__.getAddonInfo('id')
 __setting__      = __addon__.getSetting
 dialog           = xbmcgui.Dialog()
-scriptPath       = __addon__.getAddonInfo('path')
-addon_path       = xbmcvfs.translatePath('special://home/addons')
 log              = get_logger('export')
 filter_enabled         = get_bool_setting('filter_enabled')
 populate_by    = __setting__('populate_by')
@@ -55,16 +57,16 @@ default_playlist = __setting__('playlist_file')
 
 WINDOW           = xbmcgui.Window(KODI_HOME_WINDOW_ID)
 
-try:
-	spec_shows = ast.literal_eval(__setting__('selection'))
-except (ValueError, SyntaxError):
-	spec_shows = []
-
 
 # JSON-RPC query for playlist files
 plf = {"jsonrpc": "2.0", "id": 1, "method": "Files.GetDirectory",
        "params": {"directory": "special://profile/playlists/video/", "media": "video"}}
 
+# JSON-RPC query for TV shows with unwatched episodes, most recently played first
+unwatched_shows_query = {"jsonrpc": "2.0", "id": 1, "method": "VideoLibrary.GetTVShows",
+       "params": {"filter": {"field": "playcount", "operator": "is", "value": "0"},
+                  "properties": ["lastplayed"], "sort": {"order": "descending", "method": "lastplayed"}}}
+
 
 def playlist_selection_window():
 	'''Launch Select Window populated with smart playlists'''
@@ -105,7 +107,8 @@ def get_files():
 					else:
 						population = {'playlist': default_playlist}
 			else:
-				population = {'usersel':spec_shows}
+				# the selection setting is only parsed when it is actually used
+				population = {'usersel': parse_show_id_list(__setting__('selection'))}
 		else:
 			population = {'none':''}
 
@@ -146,10 +149,10 @@ def convert_pl_to_showlist(pop):
 	clean_path = 'special://profile/playlists/video/' + filename
 
 	#retrieve the shows in the supplied playlist, save their ids to a list
-	plf  = {"jsonrpc": "2.0","id": 1, "method": "Files.GetDirectory", 		"params": {"directory": "special://profile/playlists/video/", "media": "video"}}
-	plf['params']['directory'] = clean_path
+	playlist_query = {"jsonrpc": "2.0", "id": 1, "method": "Files.GetDirectory",
+	                  "params": {"directory": clean_path, "media": "video"}}
 
-	playlist_contents = json_query(plf, True)
+	playlist_contents = json_query(playlist_query, True)
 
 	if 'files' not in playlist_contents:
 		log.warning("No files found in playlist", event="export.empty_playlist")
@@ -159,12 +162,11 @@ def convert_pl_to_showlist(pop):
 			log.warning("Playlist contains no files", event="export.empty_playlist")
 			sys.exit()
 		else:
-			for x in playlist_contents['files']:
-				filtered_showids = [x['id'] for x in playlist_contents['files'] if x['type'] == 'tvshow']
-				log.debug("Shows extracted from playlist", show_ids=filtered_showids)
-				if not filtered_showids:
-					log.warning("No TV shows found in playlist", event="export.no_shows")
-					sys.exit()
+			filtered_showids = [item['id'] for item in playlist_contents['files'] if item['type'] == 'tvshow']
+			log.debug("Shows extracted from playlist", show_ids=filtered_showids)
+			if not filtered_showids:
+				log.warning("No TV shows found in playlist", event="export.no_shows")
+				sys.exit()
 
 	#returns the list of all and filtered shows and episodes
 	return filtered_showids
@@ -175,24 +177,15 @@ def get_TVshows():
 		'''
 
 	#get the most recent info on inProgress TV shows, cross-check it with what is currently stored
-	query          = '{"jsonrpc": "2.0","method": "VideoLibrary.GetTVShows","params": {"filter": {"field": "playcount", "operator": "is", "value": "0" },"properties": ["lastplayed"], "sort": {"order": "descending", "method": "lastplayed"} },"id": "1" }'
-
-	shows_retrieved = xbmc.executeJSONRPC(query)
-	shows_retrieved = json.loads(shows_retrieved)
+	shows_retrieved = json_query(unwatched_shows_query, True).get('tvshows') or []
 
 	log.debug("TV shows query completed")
 
-	if 'result' in shows_retrieved and 'tvshows' in shows_retrieved["result"] and shows_retrieved['result']['tvshows']:
-		shows_retrieved = shows_retrieved['result']['tvshows']
-	else:
-		shows_retrieved = {}
-
-
 	shows_from_service = WINDOW.getProperty(PROP_SHOWS_WITH_NEXT_EPISODES)
 
 	if shows_from_service:
-		show_id_list = ast.literal_eval(shows_from_service)
-		shows_stored = [int(x) for x in show_id_list]
+		show_id_list = json.loads(shows_from_service)
+		shows_stored = {int(x) for x in show_id_list}
 	else:
 		log.warning("Service not running during export", event="export.service_missing")
 		dialog.ok('EasyTV', lang(32115) + '\n' + lang(32116))
@@ -200,13 +193,39 @@ def get_TVshows():
 
 	active_shows = [x['tvshowid'] for x in shows_retrieved if x['tvshowid'] in shows_stored]
 
-	stored_file_data = [[WINDOW.getProperty("EasyTV.%s.File"  % x),x] for x in active_shows]
+	get_prop = WINDOW.getProperty
+	stored_file_data = [[get_prop(f"EasyTV.{x}.File"), x] for x in active_shows]
 
 	log.debug("TV shows retrieved", show_count=len(stored_file_data))
 
 	return stored_file_data
 
 
+def is_vfs_path(path):
+	''' true for Kodi VFS urls (special://, smb://, nfs://, ...) that the os module cannot open
+		'''
+	return '://' in path
+
+
+def file_exists(path):
+	''' checks for an existing file, through Kodi's VFS for urls
+		'''
+	if is_vfs_path(path):
+		return xbmcvfs.exists(path)
+	return os.path.isfile(path)
+
+
+def copy_file(src, dst):
+	''' copies a single file; urls go through xbmcvfs.copy, which reuses Kodi's
+		own SMB/NFS connections, local paths use shutil.copyfile
+		'''
+	if is_vfs_path(src) or is_vfs_path(dst):
+		if not xbmcvfs.copy(src, dst):
+			raise OSError('xbmcvfs.copy failed for {}'.format(src))
+	else:
+		shutil.copyfile(src, dst)
+
+
 def Main():
 	try:
 		# open location selection window
@@ -224,16 +243,12 @@ def Main():
 		progress_dialog = xbmcgui.DialogProgress()
 		progress_dialog.create('EasyTV', lang(32183))
 
-		sizes = []
-		running_size = 0
 		log.debug("Files to export", file_count=len(file_list), files=file_list)
-		for f in file_list:
-			try:
-				sizes.append(os.path.getsize(f))
-			except OSError:
-				sizes.append(0)
 
 		failures = []
+		# progress is by file count: sizing every source up front costs a stat per
+		# file, which is slow on network shares
+		total_files = float(len(file_list)) or 1.0
 
 		for i, video_file in enumerate(file_list):
 
@@ -241,15 +256,16 @@ def Main():
 				log.info("Export cancelled by user", event="export.cancel")
 				sys.exit()
 
-			prog = running_size / float(sum(sizes) or 1)
+			prog = i / total_files
 
 			fn = os.path.basename(video_file)
+			dst = os.path.join(location, fn)
 
 			progress_dialog.update(int(prog * 100.0), '{} {}'.format(lang(32184), fn))
 
 			try:
-				if not os.path.isfile(os.path.join(location, fn)):
-					shutil.copyfile(video_file, os.path.join(location, fn))
+				if not file_exists(dst):
+					copy_file(video_file, dst)
 					log.debug("File exported", filename=fn)
 				else:
 					log.debug("File already exists at destination", filename=fn)
@@ -257,8 +273,6 @@ def Main():
 				failures.append(fn)
 				log.warning("File export failed", event="export.file_fail", filename=fn)
 
-			running_size += sizes[i]
-
 		progress_dialog.close()
 
 		if failures:
@@ -15,9 +15,18 @@ to improve maintainability and make the code self-documenting.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
-from xml.sax.saxutils import escape
+from dataclasses import dataclass, field
+from typing import Tuple
+
+
+def _escape(text: str) -> str:
+    """Escape &, < and > for XML text (same as xml.sax.saxutils.escape).
+
+    Kept local because importing xml.sax.saxutils pulls in urllib.request,
+    http.client and email, and this module is imported on every launch.
+    """
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
 
 # =============================================================================
 # Episode Selection Modes (parallel to movie_selection)
@@ -100,9 +109,16 @@ DIALOG_WAIT_SLEEP_MS = 100
 # Addon operations
 ADDON_ENABLE_DELAY_MS = 1000
 ADDON_RESTART_DELAY_MS = 1000
+# After UpdateLocalAddons: poll for the (new) addon with escalating sleeps,
+# capped at the fixed wait this replaced
+ADDON_SCAN_POLL_BACKOFF_MS = (50, 100, 200, 400)
+ADDON_SCAN_TIMEOUT_MS = 3000
 
 # File/Service operations
-SERVICE_POLL_SLEEP_MS = 10
+# Service liveness check: escalating sleeps between polls, so a running
+# service is detected within a few ms while a missing one still times out.
+SERVICE_POLL_BACKOFF_MS = (1, 2, 5, 10, 20, 50, 100)
+SERVICE_POLL_TIMEOUT_MS = 5000
 FILE_WRITE_DELAY_MS = 10
 EXPORT_COMPLETE_DELAY_MS = 100
 
@@ -111,7 +127,6 @@ EXPORT_COMPLETE_DELAY_MS = 100
 # =============================================================================
 TARGET_DETECTION_MAX_TICKS = 20
 POSITION_CHECK_INTERVAL_TICKS = 50
-SERVICE_POLL_TIMEOUT_TICKS = 500
 DIALOG_WAIT_MAX_TICKS = 5
 ISTREAM_FIX_MAX_RETRIES = 2
 SYNC_CHECK_INTERVAL_TICKS = 3000  # ~5 minutes at 100ms per tick
@@ -192,6 +207,17 @@ class PlaylistCategory:
     season_premieres: PlaylistDef
 
 
+def _category_filenames(category: PlaylistCategory) -> Tuple[str, ...]:
+    """Return the filenames of a category's five playlists, in field order."""
+    return (
+        category.all_shows.filename,
+        category.continue_watching.filename,
+        category.start_fresh.filename,
+        category.show_premieres.filename,
+        category.season_premieres.filename,
+    )
+
+
 @dataclass(frozen=True)
 class PlaylistConfig:
     """
@@ -204,60 +230,55 @@ class PlaylistConfig:
     tvshow: PlaylistCategory
     episode_xml_footer: str
     tvshow_xml_footer: str
+    # Filename tuples, derived once in __post_init__ (the config is frozen)
+    _episode_filenames: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _tvshow_filenames: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _filenames: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        episode = _category_filenames(self.episode)
+        tvshow = _category_filenames(self.tvshow)
+        object.__setattr__(self, '_episode_filenames', episode)
+        object.__setattr__(self, '_tvshow_filenames', tvshow)
+        object.__setattr__(self, '_filenames', episode + tvshow)
     
     def episode_xml_header(self, name: str) -> str:
         """Generate XML header for an Episode playlist."""
         return (
             '<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>'
             '<smartplaylist type="episodes">'
-            '<name>{name}</name>'
+            f'<name>{_escape(name)}</name>'
             '<match>one</match>\n'
-        ).format(name=escape(name))
+        )
     
     def tvshow_xml_header(self, name: str) -> str:
         """Generate XML header for a TVShow playlist."""
         return (
             '<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>'
             '<smartplaylist type="tvshows">'
-            '<name>{name}</name>'
+            f'<name>{_escape(name)}</name>'
             '<match>one</match>\n'
-        ).format(name=escape(name))
+        )
     
     def episode_entry(self, show_id: int, filename: str) -> str:
         """Generate an Episode playlist entry (matches by filename)."""
-        return '<!--{show_id}--><rule field="filename" operator="is"><value>{filename}</value></rule>\n'.format(
-            show_id=show_id, filename=escape(filename)
-        )
+        return f'<!--{show_id}--><rule field="filename" operator="is"><value>{_escape(filename)}</value></rule>\n'
     
     def tvshow_entry(self, show_id: int, title: str) -> str:
         """Generate a TVShow playlist entry (matches by show title)."""
-        return '<!--{show_id}--><rule field="title" operator="is"><value>{title}</value></rule>\n'.format(
-            show_id=show_id, title=escape(title)
-        )
+        return f'<!--{show_id}--><rule field="title" operator="is"><value>{_escape(title)}</value></rule>\n'
     
-    def all_episode_filenames(self) -> List[str]:
-        """Return list of all Episode playlist filenames."""
-        return [
-            self.episode.all_shows.filename,
-            self.episode.continue_watching.filename,
-            self.episode.start_fresh.filename,
-            self.episode.show_premieres.filename,
-            self.episode.season_premieres.filename,
-        ]
+    def all_episode_filenames(self) -> Tuple[str, ...]:
+        """Return all Episode playlist filenames."""
+        return self._episode_filenames
     
-    def all_tvshow_filenames(self) -> List[str]:
-        """Return list of all TVShow playlist filenames."""
-        return [
-            self.tvshow.all_shows.filename,
-            self.tvshow.continue_watching.filename,
-            self.tvshow.start_fresh.filename,
-            self.tvshow.show_premieres.filename,
-            self.tvshow.season_premieres.filename,
-        ]
+    def all_tvshow_filenames(self) -> Tuple[str, ...]:
+        """Return all TVShow playlist filenames."""
+        return self._tvshow_filenames
     
-    def all_filenames(self) -> List[str]:
-        """Return list of all playlist filenames (Episode + TVShow)."""
-        return self.all_episode_filenames() + self.all_tvshow_filenames()
+    def all_filenames(self) -> Tuple[str, ...]:
+        """Return all playlist filenames (Episode + TVShow)."""
+        return self._filenames
 
 
 # Singleton configuration instance
@@ -311,13 +332,13 @@ PLAYLIST_CONFIG = PlaylistConfig(
 )
 
 # Legacy playlist filenames (for cleanup during format migration)
-LEGACY_PLAYLIST_FILES = [
+LEGACY_PLAYLIST_FILES = (
     "EasyTV - All Shows.xsp",
     "EasyTV - Continue Watching.xsp",
     "EasyTV - Start Fresh.xsp",
     "EasyTV - Show Premieres.xsp",
     "EasyTV - Season Premieres.xsp",
-]
+)
 
 # =============================================================================
 # Show Categorization Constants
@@ -460,6 +481,11 @@ DURATION_CACHE_VERSION = 1
 STREAMDETAILS_CACHE_FILENAME = "streamdetails_cache.json"
 # Schema version for cache file format (increment on breaking changes)
 STREAMDETAILS_CACHE_VERSION = 1
+# Concurrent per-show streamdetails queries during a bulk refresh. Kodi
+# releases the GIL in executeJSONRPC; kept small for SQLite on low-end boxes.
+STREAMDETAILS_QUERY_WORKERS = 4
+# Shows fetched per JSON-RPC batch by each streamdetails worker
+STREAMDETAILS_BATCH_SIZE = 10
 
 # =============================================================================
 # Service / System Window Properties
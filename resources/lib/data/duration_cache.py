@@ -38,17 +38,14 @@ Usage:
     shows_to_calc = get_shows_needing_calculation(cache, current_counts)
     
     # Calculate durations for changed shows only
+    new_durations = {}
     for show_id in shows_to_calc:
         episodes = fetch_episodes_with_streamdetails(show_id)
-        median = calculate_median_duration(episodes)
-        cache['shows'][str(show_id)] = {
-            'title': show_titles.get(show_id, ''),
-            'median_seconds': median,
-            'episode_count': current_counts[show_id],
-            'calculated_at': datetime.now().isoformat()
-        }
+        new_durations[show_id] = calculate_median_duration(episodes)
     
-    save_duration_cache(cache)
+    # The loaded cache is shared and read-only; save a newly built one
+    updated = build_updated_cache(cache, current_counts, new_durations, show_titles)
+    save_duration_cache(updated)
 
 Logging:
     Logger: 'data' (via get_logger)
@@ -65,7 +62,7 @@ from __future__ import annotations
 import json
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import xbmcvfs
 
@@ -82,6 +79,9 @@ log = get_logger('data')
 # Cached file path (lazily initialized)
 _cache_file_path: Optional[str] = None
 
+# Last cache loaded from disk, keyed by the file's mtime (st_mtime_ns)
+_loaded_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
 
 def get_cache_file_path() -> str:
     """
@@ -98,9 +98,8 @@ def get_cache_file_path() -> str:
         cache_dir = xbmcvfs.translatePath(
             f"special://profile/addon_data/{DEFAULT_ADDON_ID}/"
         )
-        # Ensure directory exists
-        if not xbmcvfs.exists(cache_dir):
-            xbmcvfs.mkdirs(cache_dir)
+        # Ensure directory exists; mkdirs already returns early when the folder exists
+        xbmcvfs.mkdirs(cache_dir)
         _cache_file_path = os.path.join(cache_dir, DURATION_CACHE_FILENAME)
     return _cache_file_path
 
@@ -112,8 +111,13 @@ def load_duration_cache() -> Dict[str, Any]:
     Handles missing files, corrupted JSON, and version mismatches gracefully
     by returning an empty cache structure.
     
+    While the file's mtime is unchanged, repeated calls return the same
+    parsed dict without re-reading the file, so callers must treat it as
+    read-only (build_updated_cache already returns a new cache).
+    
     Returns:
-        Cache dictionary with 'version' and 'shows' keys.
+        Cache dictionary with 'version' and 'shows' keys. 'shows' is always
+        present and a dict, so callers may index it directly.
         Empty cache if file missing, corrupted, or version mismatch.
     
     Example:
@@ -121,13 +125,19 @@ def load_duration_cache() -> Dict[str, Any]:
         >>> cache['shows'].get('123', {}).get('median_seconds', 0)
         2580
     """
+    global _loaded_cache
     cache_path = get_cache_file_path()
     
     # Return empty cache if file doesn't exist
-    if not xbmcvfs.exists(cache_path):
+    try:
+        mtime_ns = os.stat(cache_path).st_mtime_ns
+    except OSError:
         log.debug("Duration cache file not found, starting fresh")
         return _empty_cache()
     
+    if _loaded_cache is not None and _loaded_cache[0] == mtime_ns:
+        return _loaded_cache[1]
+    
     try:
         with open(cache_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
@@ -154,6 +164,7 @@ def load_duration_cache() -> Dict[str, Any]:
         
         show_count = len(data['shows'])
         log.debug("Duration cache loaded", show_count=show_count)
+        _loaded_cache = (mtime_ns, data)
         return data
         
     except json.JSONDecodeError as e:
@@ -168,7 +179,8 @@ def save_duration_cache(cache: Dict[str, Any]) -> bool:
     """
     Save the duration cache to disk.
     
-    Writes atomically by ensuring the full JSON is serialized before writing.
+    Streams compact JSON to a temporary file next to the cache and swaps it
+    in with os.replace, so a failed save never leaves a truncated cache.
     
     Args:
         cache: Cache dictionary with 'version' and 'shows' keys.
@@ -186,17 +198,19 @@ def save_duration_cache(cache: Dict[str, Any]) -> bool:
         >>> save_duration_cache(cache)
         True
     """
+    global _loaded_cache
     cache_path = get_cache_file_path()
     
     # Ensure version is set
     cache['version'] = DURATION_CACHE_VERSION
     
+    tmp_path = cache_path + '.tmp'
     try:
-        # Serialize first to catch errors before opening file
-        json_data = json.dumps(cache, indent=2)
-        
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            f.write(json_data)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, separators=(',', ':'), ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+        # The next load re-reads the file (its mtime has changed anyway)
+        _loaded_cache = None
         
         show_count = len(cache.get('shows', {}))
         log.debug("Duration cache saved", show_count=show_count)
@@ -204,6 +218,10 @@ def save_duration_cache(cache: Dict[str, Any]) -> bool:
         
     except (OSError, IOError, TypeError) as e:
         log.warning("Duration cache save failed", error=str(e))
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return False
 
 
@@ -235,25 +253,31 @@ def calculate_median_duration(episodes: List[Dict[str, Any]]) -> int:
         like double-length finales or specials.
     """
     durations = []
+    append = durations.append
     
     for ep in episodes:
-        stream_details = ep.get('streamdetails', {})
-        video_streams = stream_details.get('video', [])
-        if video_streams:
-            duration = video_streams[0].get('duration', 0)
-            if duration > 0:
-                durations.append(duration)
+        # Missing keys are skipped via falsy checks rather than {}/[]
+        # defaults, so no throwaway containers are built per episode
+        stream_details = ep.get('streamdetails')
+        if not stream_details:
+            continue
+        video_streams = stream_details.get('video')
+        if not video_streams:
+            continue
+        duration = video_streams[0].get('duration', 0)
+        if duration > 0:
+            append(duration)
     
     if not durations:
         return 0
     
-    # Calculate median
-    sorted_durations = sorted(durations)
-    n = len(sorted_durations)
+    # Calculate median (durations is a private list, so sort it in place)
+    durations.sort()
+    n = len(durations)
     mid = n // 2
     if n % 2 == 0:
-        return (sorted_durations[mid - 1] + sorted_durations[mid]) // 2
-    return sorted_durations[mid]
+        return (durations[mid - 1] + durations[mid]) // 2
+    return durations[mid]
 
 
 def get_shows_needing_calculation(
@@ -272,7 +296,8 @@ def get_shows_needing_calculation(
     (they were removed from the library).
     
     Args:
-        cache: Loaded cache dictionary from load_duration_cache().
+        cache: Loaded cache dictionary from load_duration_cache() (must have
+            a 'shows' dict).
         current_episode_counts: Dict mapping show_id (int) to episode count.
     
     Returns:
@@ -288,17 +313,16 @@ def get_shows_needing_calculation(
         {200, 300}  # 200: was 0 eps now 5, 300: new show
     """
     needs_calculation: Set[int] = set()
-    cached_shows = cache.get('shows', {})
+    cached_shows = cache['shows']
     
     for show_id, episode_count in current_episode_counts.items():
-        show_id_str = str(show_id)
+        cached_data = cached_shows.get(str(show_id))
         
-        if show_id_str not in cached_shows:
+        if cached_data is None:
             # New show, not in cache
             needs_calculation.add(show_id)
             continue
         
-        cached_data = cached_shows[show_id_str]
         cached_count = cached_data.get('episode_count', 0)
         cached_median = cached_data.get('median_seconds', 0)
         
@@ -312,14 +336,16 @@ def get_shows_needing_calculation(
         if cached_median == 0 and episode_count > 0:
             needs_calculation.add(show_id)
     
-    # Log summary
-    cached_count = len(current_episode_counts) - len(needs_calculation)
-    log.debug(
-        "Duration cache comparison",
-        total_shows=len(current_episode_counts),
-        cached_shows=cached_count,
-        needs_calculation=len(needs_calculation)
-    )
+    # Log summary (skipped entirely when debug logging is off)
+    if log.debug_enabled:
+        total_shows = len(current_episode_counts)
+        needs_count = len(needs_calculation)
+        log.debug(
+            "Duration cache comparison",
+            total_shows=total_shows,
+            cached_shows=total_shows - needs_count,
+            needs_calculation=needs_count
+        )
     
     return needs_calculation
 
@@ -339,8 +365,11 @@ def build_updated_cache(
     - Prunes entries for shows no longer in the library
     - Includes show titles for debugging/readability
     
+    Unchanged entries are shared with old_cache rather than copied; old_cache
+    itself is never modified.
+    
     Args:
-        old_cache: Previously loaded cache dictionary.
+        old_cache: Previously loaded cache dictionary (must have a 'shows' dict).
         current_episode_counts: Dict mapping show_id (int) to current episode count.
         new_durations: Dict mapping show_id (int) to newly calculated median duration.
         show_titles: Optional dict mapping show_id (int) to show title string.
@@ -358,7 +387,7 @@ def build_updated_cache(
         True
     """
     new_cache = _empty_cache()
-    old_shows = old_cache.get('shows', {})
+    old_shows = old_cache['shows']
     now = datetime.now().isoformat(timespec='seconds')
     titles = show_titles or {}
     
@@ -377,14 +406,19 @@ def build_updated_cache(
                     'episode_count': episode_count,
                     'calculated_at': now
                 }
-        elif show_id_str in old_shows:
-            # Carry over from old cache (unchanged)
-            old_entry = old_shows[show_id_str].copy()
-            # Update title if we have a newer one (handles renames)
+        else:
+            old_entry = old_shows.get(show_id_str)
+            if old_entry is None:
+                continue
+            # Carry over from old cache (unchanged). The entry is only copied
+            # when its title changes, so a steady-state startup shares the
+            # old entries instead of copying every one of them.
             if title:
-                old_entry['title'] = title
+                # Update title if we have a newer one (handles renames)
+                if old_entry.get('title') != title:
+                    old_entry = dict(old_entry, title=title)
             elif 'title' not in old_entry:
-                old_entry['title'] = ''
+                old_entry = dict(old_entry, title='')
             new_cache['shows'][show_id_str] = old_entry
     
     return new_cache
@@ -395,7 +429,8 @@ def _empty_cache() -> Dict[str, Any]:
     Create an empty cache structure.
     
     Returns:
-        Empty cache dict with version and empty shows dict.
+        Empty cache dict with version and empty shows dict. Every cache this
+        module hands out has this shape.
     """
     return {
         'version': DURATION_CACHE_VERSION,
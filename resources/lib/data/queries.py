@@ -27,6 +27,7 @@ Usage:
         get_unwatched_shows_query,
         build_random_episodes_query,
         get_episode_filter,
+        serialized_query,
         FILTER_UNWATCHED,
     )
     from resources.lib.utils import json_query
@@ -39,10 +40,15 @@ Usage:
     filters = [episode_filter] if episode_filter else []
     query = build_random_episodes_query(tvshowid=123, filters=filters, limit=10)
     result = json_query(query)
+    
+    # Parameterless query on a repeated path: serialize once
+    result = json_query(serialized_query(get_unwatched_shows_query))
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import functools
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from resources.lib.constants import (
     EPISODE_SELECTION_BOTH,
@@ -50,11 +56,30 @@ from resources.lib.constants import (
     EPISODE_SELECTION_WATCHED,
 )
 
+# =============================================================================
+# Request Envelope
+# =============================================================================
+
+def _rpc(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Wrap a method and its params in a JSON-RPC 2.0 request envelope.
+    
+    Args:
+        method: The Kodi JSON-RPC method name.
+        params: The method parameters.
+    
+    Returns:
+        A fresh request dict (id 1; see build_jsonrpc_batch for batches).
+    """
+    return {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+
+
 # =============================================================================
 # Filter Constants
 # =============================================================================
 # Reusable filter definitions for playcount-based filtering.
 # These are used by episode and movie query builders for consistency.
+# Shared, not copied: treat them as read-only (they are only serialized).
 
 FILTER_UNWATCHED: Dict[str, str] = {
     'field': 'playcount',
@@ -78,7 +103,8 @@ def get_episode_filter(selection_mode: int) -> Optional[Dict[str, str]]:
                        EPISODE_SELECTION_WATCHED (1), or EPISODE_SELECTION_BOTH (2).
     
     Returns:
-        Filter dict for unwatched/watched, or None for "both" (no filter needed).
+        The shared (read-only) filter dict for unwatched/watched, or None
+        for "both" (no filter needed).
     
     Example:
         >>> get_episode_filter(EPISODE_SELECTION_UNWATCHED)
@@ -87,9 +113,9 @@ def get_episode_filter(selection_mode: int) -> Optional[Dict[str, str]]:
         None
     """
     if selection_mode == EPISODE_SELECTION_UNWATCHED:
-        return FILTER_UNWATCHED.copy()
+        return FILTER_UNWATCHED
     elif selection_mode == EPISODE_SELECTION_WATCHED:
-        return FILTER_WATCHED.copy()
+        return FILTER_WATCHED
     elif selection_mode == EPISODE_SELECTION_BOTH:
         return None
     else:
@@ -97,6 +123,59 @@ def get_episode_filter(selection_mode: int) -> Optional[Dict[str, str]]:
         return None
 
 
+def _add_filters_and_limit(
+    params: Dict[str, Any],
+    filters: Optional[List[Dict[str, Any]]],
+    limit: Optional[int]
+) -> None:
+    """
+    Add optional AND-combined filters and a result limit to query params.
+    
+    Args:
+        params: The params dict to update in place.
+        filters: Filter dicts; a single filter is used as-is.
+        limit: Maximum number of results; ignored unless positive.
+    """
+    if filters:
+        if len(filters) == 1:
+            params["filter"] = filters[0]
+        else:
+            params["filter"] = {"and": filters}
+    
+    if limit is not None and limit > 0:
+        params["limits"] = {"end": limit}
+
+
+def _episodes_query(
+    tvshowid: int,
+    properties: Tuple[str, ...],
+    random_sort: bool = False,
+    filters: Optional[List[Dict[str, Any]]] = None,
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Build a VideoLibrary.GetEpisodes query for one TV show.
+    
+    Shared by the per-show episode builders, which differ only in their
+    property set, sort and filtering.
+    
+    Args:
+        tvshowid: The Kodi TV show ID.
+        properties: Episode properties to return.
+        random_sort: If True, let Kodi return the episodes in random order.
+        filters: Optional filter dicts (see _add_filters_and_limit).
+        limit: Optional maximum number of episodes to return.
+    
+    Returns:
+        Query dict for VideoLibrary.GetEpisodes.
+    """
+    params: Dict[str, Any] = {"tvshowid": tvshowid, "properties": properties}
+    if random_sort:
+        params["sort"] = {"method": "random"}
+    _add_filters_and_limit(params, filters, limit)
+    return _rpc("VideoLibrary.GetEpisodes", params)
+
+
 def build_random_episodes_query(
     tvshowid: int,
     filters: Optional[List[Dict[str, Any]]] = None,
@@ -127,33 +206,15 @@ def build_random_episodes_query(
             limit=10
         )
     """
-    params: Dict[str, Any] = {
-        "tvshowid": tvshowid,
-        "properties": [
+    return _episodes_query(
+        tvshowid,
+        (
             "season", "episode", "runtime", "resume",
             "playcount", "tvshowid", "lastplayed", "file",
             "specialsortseason", "specialsortepisode"
-        ],
-        "sort": {"method": "random"}
-    }
-    
-    # Add filter if provided
-    if filters:
-        if len(filters) == 1:
-            params["filter"] = filters[0]
-        else:
-            params["filter"] = {"and": filters}
-    
-    # Add limit if provided
-    if limit is not None and limit > 0:
-        params["limits"] = {"end": limit}
-    
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetEpisodes",
-        "params": params
-    }
+        ),
+        random_sort=True, filters=filters, limit=limit
+    )
 
 
 def build_random_movies_query(
@@ -184,27 +245,11 @@ def build_random_movies_query(
         )
     """
     params: Dict[str, Any] = {
-        "properties": ["playcount", "title", "runtime", "resume", "file"],
+        "properties": ("playcount", "title", "runtime", "resume", "file"),
         "sort": {"method": "random"}
     }
-    
-    # Add filter if provided
-    if filters:
-        if len(filters) == 1:
-            params["filter"] = filters[0]
-        else:
-            params["filter"] = {"and": filters}
-    
-    # Add limit if provided
-    if limit is not None and limit > 0:
-        params["limits"] = {"end": limit}
-    
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetMovies",
-        "params": params
-    }
+    _add_filters_and_limit(params, filters, limit)
+    return _rpc("VideoLibrary.GetMovies", params)
 
 
 def build_inprogress_episodes_query() -> Dict[str, Any]:
@@ -230,22 +275,17 @@ def build_inprogress_episodes_query() -> Dict[str, Any]:
         The caller is responsible for filtering results by show_ids if only
         certain shows are in scope (e.g., filtered by smart playlist).
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetEpisodes",
-        "params": {
-            "properties": [
-                "season", "episode", "playcount", "tvshowid",
-                "lastplayed", "resume"
-            ],
-            "filter": {
-                "field": "inprogress",
-                "operator": "true",
-                "value": ""
-            }
+    return _rpc("VideoLibrary.GetEpisodes", {
+        "properties": (
+            "season", "episode", "playcount", "tvshowid",
+            "lastplayed", "resume"
+        ),
+        "filter": {
+            "field": "inprogress",
+            "operator": "true",
+            "value": ""
         }
-    }
+    })
 
 
 def build_inprogress_movies_query() -> Dict[str, Any]:
@@ -271,19 +311,14 @@ def build_inprogress_movies_query() -> Dict[str, Any]:
         The caller is responsible for filtering results by movie_ids if only
         certain movies are in scope (e.g., filtered by smart playlist).
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetMovies",
-        "params": {
-            "properties": ["playcount", "lastplayed", "resume"],
-            "filter": {
-                "field": "inprogress",
-                "operator": "true",
-                "value": ""
-            }
+    return _rpc("VideoLibrary.GetMovies", {
+        "properties": ("playcount", "lastplayed", "resume"),
+        "filter": {
+            "field": "inprogress",
+            "operator": "true",
+            "value": ""
         }
-    }
+    })
 
 
 # =============================================================================
@@ -297,15 +332,10 @@ def get_playlist_files_query() -> Dict[str, Any]:
     Returns:
         Query to retrieve playlist files from special://profile/playlists/video/
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "Files.GetDirectory",
-        "params": {
-            "directory": "special://profile/playlists/video/",
-            "media": "video"
-        }
-    }
+    return _rpc("Files.GetDirectory", {
+        "directory": "special://profile/playlists/video/",
+        "media": "video"
+    })
 
 
 # =============================================================================
@@ -319,14 +349,9 @@ def get_clear_video_playlist_query() -> Dict[str, Any]:
     Returns:
         Query to clear the video playlist.
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "Playlist.Clear",
-        "params": {
-            "playlistid": 1
-        }
-    }
+    return _rpc("Playlist.Clear", {
+        "playlistid": 1
+    })
 
 
 def build_add_episode_query(episode_id: int) -> Dict[str, Any]:
@@ -339,15 +364,10 @@ def build_add_episode_query(episode_id: int) -> Dict[str, Any]:
     Returns:
         Query to add the episode to playlist.
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "Playlist.Add",
-        "params": {
-            "playlistid": 1,
-            "item": {"episodeid": episode_id}
-        }
-    }
+    return _rpc("Playlist.Add", {
+        "playlistid": 1,
+        "item": {"episodeid": episode_id}
+    })
 
 
 def build_add_movie_query(movie_id: int) -> Dict[str, Any]:
@@ -360,15 +380,30 @@ def build_add_movie_query(movie_id: int) -> Dict[str, Any]:
     Returns:
         Query to add the movie to playlist.
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "Playlist.Add",
-        "params": {
-            "playlistid": 1,
-            "item": {"movieid": movie_id}
-        }
-    }
+    return _rpc("Playlist.Add", {
+        "playlistid": 1,
+        "item": {"movieid": movie_id}
+    })
+
+
+def build_add_items_batch_query(items: List[Tuple[str, int]]) -> List[Dict[str, Any]]:
+    """
+    Add several episodes and movies to the video playlist in one request.
+    
+    Kodi runs a batch in order, so the playlist order matches ``items``.
+    
+    Args:
+        items: (item_type, item_id) pairs, item_type being 'episode' or
+               'movie' as returned by PlaylistSession.pick_next_item().
+    
+    Returns:
+        Batch of Playlist.Add requests with unique ids.
+    """
+    return build_jsonrpc_batch([
+        build_add_episode_query(item_id) if item_type == 'episode'
+        else build_add_movie_query(item_id)
+        for item_type, item_id in items
+    ])
 
 
 # =============================================================================
@@ -387,22 +422,17 @@ def get_unwatched_shows_query() -> Dict[str, Any]:
         Query for shows with unwatched episodes, including metadata
         for display (genre, title, mpaa, episode counts, thumbnail, year).
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetTVShows",
-        "params": {
-            "filter": {
-                "field": "playcount",
-                "operator": "is",
-                "value": "0"
-            },
-            "properties": [
-                "genre", "title", "playcount", "mpaa",
-                "watchedepisodes", "episode", "thumbnail", "year"
-            ]
-        }
-    }
+    return _rpc("VideoLibrary.GetTVShows", {
+        "filter": {
+            "field": "playcount",
+            "operator": "is",
+            "value": "0"
+        },
+        "properties": (
+            "genre", "title", "playcount", "mpaa",
+            "watchedepisodes", "episode", "thumbnail", "year"
+        )
+    })
 
 
 def get_all_shows_query() -> Dict[str, Any]:
@@ -412,14 +442,9 @@ def get_all_shows_query() -> Dict[str, Any]:
     Returns:
         Query for all shows with title and year properties.
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetTVShows",
-        "params": {
-            "properties": ["title", "year"]
-        }
-    }
+    return _rpc("VideoLibrary.GetTVShows", {
+        "properties": ("title", "year")
+    })
 
 
 def get_shows_by_lastplayed_query() -> Dict[str, Any]:
@@ -429,23 +454,18 @@ def get_shows_by_lastplayed_query() -> Dict[str, Any]:
     Returns:
         Query for shows sorted by lastplayed descending (most recent first).
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetTVShows",
-        "params": {
-            "filter": {
-                "field": "playcount",
-                "operator": "is",
-                "value": "0"
-            },
-            "properties": ["lastplayed", "year", "genre"],
-            "sort": {
-                "order": "descending",
-                "method": "lastplayed"
-            }
+    return _rpc("VideoLibrary.GetTVShows", {
+        "filter": {
+            "field": "playcount",
+            "operator": "is",
+            "value": "0"
+        },
+        "properties": ("lastplayed", "year", "genre"),
+        "sort": {
+            "order": "descending",
+            "method": "lastplayed"
         }
-    }
+    })
 
 
 def build_show_details_query(tvshowid: int) -> Dict[str, Any]:
@@ -458,15 +478,10 @@ def build_show_details_query(tvshowid: int) -> Dict[str, Any]:
     Returns:
         Query for show details including title and year.
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetTVShowDetails",
-        "params": {
-            "tvshowid": tvshowid,
-            "properties": ["title", "year"]
-        }
-    }
+    return _rpc("VideoLibrary.GetTVShowDetails", {
+        "tvshowid": tvshowid,
+        "properties": ("title", "year")
+    })
 
 
 def build_shows_art_query() -> Dict[str, Any]:
@@ -488,14 +503,9 @@ def build_shows_art_query() -> Dict[str, Any]:
     Returns:
         Query for all shows with art property only.
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetTVShows",
-        "params": {
-            "properties": ["art"]
-        }
-    }
+    return _rpc("VideoLibrary.GetTVShows", {
+        "properties": ("art",)
+    })
 
 
 # =============================================================================
@@ -526,21 +536,16 @@ def build_all_episodes_no_streamdetails_query() -> Dict[str, Any]:
     Returns:
         Query for all episodes without streamdetails.
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetEpisodes",
-        "params": {
-            "properties": [
-                # For next-episode calculation
-                "season", "episode", "playcount", "tvshowid", "file",
-                # For positioned specials support
-                "specialsortseason", "specialsortepisode",
-                # For display caching (art loaded lazily via build_shows_art_query)
-                "title", "showtitle", "plot", "firstaired", "resume"
-            ]
-        }
-    }
+    return _rpc("VideoLibrary.GetEpisodes", {
+        "properties": (
+            # For next-episode calculation
+            "season", "episode", "playcount", "tvshowid", "file",
+            # For positioned specials support
+            "specialsortseason", "specialsortepisode",
+            # For display caching (art loaded lazily via build_shows_art_query)
+            "title", "showtitle", "plot", "firstaired", "resume"
+        )
+    })
 
 
 def build_show_episodes_with_streamdetails_query(tvshowid: int) -> Dict[str, Any]:
@@ -564,15 +569,27 @@ def build_show_episodes_with_streamdetails_query(tvshowid: int) -> Dict[str, Any
     Returns:
         Query for single show's episodes with streamdetails.
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetEpisodes",
-        "params": {
-            "tvshowid": tvshowid,
-            "properties": ["tvshowid", "streamdetails"]
-        }
-    }
+    return _episodes_query(tvshowid, ("tvshowid", "streamdetails"))
+
+
+def build_multi_show_streamdetails_batch(tvshowids: List[int]) -> List[Dict[str, Any]]:
+    """
+    Get episodes WITH streamdetails for several TV shows in one request.
+    
+    One build_show_episodes_with_streamdetails_query() per show, combined
+    into a single JSON-RPC batch so a bulk refresh needs one round-trip
+    per group of shows instead of one per show.
+    
+    Args:
+        tvshowids: The Kodi TV show IDs, in the order results are wanted.
+    
+    Returns:
+        Batch for json_query_batch(); results come back in tvshowids order.
+    """
+    return build_jsonrpc_batch([
+        build_show_episodes_with_streamdetails_query(tvshowid)
+        for tvshowid in tvshowids
+    ])
 
 
 def build_show_episodes_query(tvshowid: int) -> Dict[str, Any]:
@@ -587,43 +604,56 @@ def build_show_episodes_query(tvshowid: int) -> Dict[str, Any]:
     Returns:
         Query for all episodes with playback-relevant properties.
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetEpisodes",
-        "params": {
-            "tvshowid": tvshowid,
-            "properties": [
-                "season", "episode", "playcount", "tvshowid", "file",
-                "specialsortseason", "specialsortepisode"
-            ]
-        }
-    }
+    return _episodes_query(tvshowid, (
+        "season", "episode", "playcount", "tvshowid", "file",
+        "specialsortseason", "specialsortepisode"
+    ))
 
 
-def build_episode_details_query(episode_id: int) -> Dict[str, Any]:
+def build_episode_details_query(
+    episode_id: int,
+    fields: Optional[Tuple[str, ...]] = None
+) -> Dict[str, Any]:
     """
     Get full details for a specific episode.
     
     Args:
         episode_id: The Kodi episode ID.
+        fields: Optional subset of episode properties to request instead
+                of the full set. Callers that read only a few fields
+                should pass them, so Kodi skips art and streamdetails.
     
     Returns:
         Query for comprehensive episode details (for display/playback).
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetEpisodeDetails",
-        "params": {
-            "episodeid": episode_id,
-            "properties": [
-                "title", "playcount", "plot", "season", "episode",
-                "showtitle", "file", "lastplayed", "rating", "resume",
-                "art", "streamdetails", "firstaired", "runtime", "tvshowid"
-            ]
-        }
-    }
+    return _rpc("VideoLibrary.GetEpisodeDetails", {
+        "episodeid": episode_id,
+        "properties": fields or (
+            "title", "playcount", "plot", "season", "episode",
+            "showtitle", "file", "lastplayed", "rating", "resume",
+            "art", "streamdetails", "firstaired", "runtime", "tvshowid"
+        )
+    })
+
+
+def build_episode_resume_query(episode_id: int) -> Dict[str, Any]:
+    """
+    Get only the resume point for an episode.
+    
+    Used to refresh resume/progress properties when the ondeck episode is
+    unchanged, skipping the art and streamdetails lookups of
+    build_episode_details_query().
+    
+    Args:
+        episode_id: The Kodi episode ID.
+    
+    Returns:
+        Query for the episode's resume position and total.
+    """
+    return _rpc("VideoLibrary.GetEpisodeDetails", {
+        "episodeid": episode_id,
+        "properties": ("resume",)
+    })
 
 
 def build_episode_show_id_query(episode_id: int) -> Dict[str, Any]:
@@ -638,15 +668,10 @@ def build_episode_show_id_query(episode_id: int) -> Dict[str, Any]:
     Returns:
         Query for episode's tvshowid and lastplayed.
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetEpisodeDetails",
-        "params": {
-            "episodeid": episode_id,
-            "properties": ["lastplayed", "tvshowid"]
-        }
-    }
+    return _rpc("VideoLibrary.GetEpisodeDetails", {
+        "episodeid": episode_id,
+        "properties": ("lastplayed", "tvshowid")
+    })
 
 
 def build_episode_prompt_info_query(episode_id: int) -> Dict[str, Any]:
@@ -659,15 +684,10 @@ def build_episode_prompt_info_query(episode_id: int) -> Dict[str, Any]:
     Returns:
         Query for season, episode number, show title, and show ID.
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "VideoLibrary.GetEpisodeDetails",
-        "params": {
-            "episodeid": episode_id,
-            "properties": ["season", "episode", "showtitle", "tvshowid", "title"]
-        }
-    }
+    return _rpc("VideoLibrary.GetEpisodeDetails", {
+        "episodeid": episode_id,
+        "properties": ("season", "episode", "showtitle", "tvshowid", "title")
+    })
 
 
 # =============================================================================
@@ -681,18 +701,13 @@ def get_playing_item_query() -> Dict[str, Any]:
     Returns:
         Query for current player item with show/episode info.
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "Player.GetItem",
-        "params": {
-            "playerid": 1,
-            "properties": [
-                "showtitle", "tvshowid", "episode",
-                "season", "playcount", "resume"
-            ]
-        }
-    }
+    return _rpc("Player.GetItem", {
+        "playerid": 1,
+        "properties": (
+            "showtitle", "tvshowid", "episode",
+            "season", "playcount", "resume"
+        )
+    })
 
 
 def build_player_seek_query(position: float) -> Dict[str, Any]:
@@ -705,15 +720,10 @@ def build_player_seek_query(position: float) -> Dict[str, Any]:
     Returns:
         Query to seek to the specified percentage.
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "Player.Seek",
-        "params": {
-            "playerid": 1,
-            "value": {"percentage": position}
-        }
-    }
+    return _rpc("Player.Seek", {
+        "playerid": 1,
+        "value": {"percentage": position}
+    })
 
 
 def build_player_seek_time_query(seconds: int) -> Dict[str, Any]:
@@ -726,26 +736,20 @@ def build_player_seek_time_query(seconds: int) -> Dict[str, Any]:
     Returns:
         Query to seek to the specified time.
     """
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
-    
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "Player.Seek",
-        "params": {
-            "playerid": 1,
-            "value": {
-                "time": {
-                    "hours": hours,
-                    "minutes": minutes,
-                    "seconds": secs,
-                    "milliseconds": 0
-                }
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    
+    return _rpc("Player.Seek", {
+        "playerid": 1,
+        "value": {
+            "time": {
+                "hours": hours,
+                "minutes": minutes,
+                "seconds": secs,
+                "milliseconds": 0
             }
         }
-    }
+    })
 
 
 # =============================================================================
@@ -762,13 +766,47 @@ def build_playlist_get_items_query(playlist_path: str) -> Dict[str, Any]:
     Returns:
         Query to retrieve playlist contents.
     """
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "Files.GetDirectory",
-        "params": {
-            "directory": playlist_path,
-            "media": "video",
-            "properties": ["tvshowid"]
-        }
-    }
+    return _rpc("Files.GetDirectory", {
+        "directory": playlist_path,
+        "media": "video",
+        "properties": ("tvshowid",)
+    })
+
+
+def build_jsonrpc_batch(calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Combine several queries into one JSON-RPC 2.0 batch request.
+    
+    Every builder in this module uses ``"id": 1``, so each call is copied
+    with a unique id (1..N, in list order) so responses can be matched
+    back to their requests. The input dicts are not modified.
+    
+    Args:
+        calls: Query dicts as returned by the builders above.
+    
+    Returns:
+        Batch array to pass to json_query_batch().
+    
+    Example:
+        >>> shows, art = json_query_batch(build_jsonrpc_batch([
+        ...     get_all_shows_query(), build_shows_art_query()]))
+    """
+    return [dict(call, id=i) for i, call in enumerate(calls, 1)]
+
+
+@functools.lru_cache(maxsize=None)
+def serialized_query(builder: Callable[[], Dict[str, Any]]) -> str:
+    """
+    Get the JSON text of a parameterless query, serialized once per builder.
+    
+    For get_*_query() builders whose output never changes. json_query()
+    sends a str as-is, skipping the json.dumps it would otherwise repeat
+    on every call.
+    
+    Args:
+        builder: A parameterless query builder from this module.
+    
+    Returns:
+        The serialized query, ready to pass to json_query().
+    """
+    return json.dumps(builder())
@@ -28,6 +28,7 @@ Logging:
 from __future__ import annotations
 
 import ast
+import json
 import os
 import random
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
@@ -52,6 +53,7 @@ from resources.lib.data.queries import (
     build_show_episodes_query,
     get_all_shows_query,
     get_unwatched_shows_query,
+    serialized_query,
 )
 from resources.lib.service.episode_tracker import PROP_DURATION
 from resources.lib.utils import (
@@ -262,7 +264,9 @@ def find_next_episode(
             return None, None
 
     # Get details of next episode
-    ep_details = json_query(build_episode_details_query(next_ep), True)
+    ep_details = json_query(
+        build_episode_details_query(next_ep, ('season', 'episode')), True
+    )
 
     if 'episodedetails' in ep_details and ep_details['episodedetails']:
         details = ep_details['episodedetails']
@@ -324,13 +328,17 @@ def merge_and_sort_shows(
     """
     log.debug("Sorting shows", method=sort_by, reverse=sort_reverse)
     
+    # Loop-invariant lookups for the per-show comprehensions below
+    get_prop = WINDOW.getProperty
+    service_ids = set(shows_from_service)
+    
     if sort_by == 0:
         # SORT BY show name
         intermediate = [
             [x['label'], 
              parse_lastplayed_date(x['lastplayed']) if x.get('lastplayed') else 0, 
              x['tvshowid']] 
-            for x in shows_from_query if x['tvshowid'] in shows_from_service
+            for x in shows_from_query if x['tvshowid'] in service_ids
         ]
         intermediate.sort(key=lambda x: generate_sort_key(x[0], language), reverse=sort_reverse)
         return [x[1:] for x in intermediate]
@@ -338,10 +346,10 @@ def merge_and_sort_shows(
     elif sort_by == 2:
         # Sort by Unwatched Episodes count
         intermediate = [
-            [int(WINDOW.getProperty("EasyTV.%s.CountonDeckEps" % x['tvshowid']) or 0),
+            [int(get_prop("EasyTV.%s.CountonDeckEps" % x['tvshowid']) or 0),
              parse_lastplayed_date(x['lastplayed']) if x.get('lastplayed') else 0,
              x['tvshowid']]
-            for x in shows_from_query if x['tvshowid'] in shows_from_service
+            for x in shows_from_query if x['tvshowid'] in service_ids
         ]
         # Default is descending; sort_reverse inverts to ascending
         intermediate.sort(reverse=not sort_reverse)
@@ -350,10 +358,10 @@ def merge_and_sort_shows(
     elif sort_by == 3:
         # Sort by Watched Episodes count
         intermediate = [
-            [int(WINDOW.getProperty("EasyTV.%s.CountWatchedEps" % x['tvshowid']) or 0),
+            [int(get_prop("EasyTV.%s.CountWatchedEps" % x['tvshowid']) or 0),
              parse_lastplayed_date(x['lastplayed']) if x.get('lastplayed') else 0,
              x['tvshowid']]
-            for x in shows_from_query if x['tvshowid'] in shows_from_service
+            for x in shows_from_query if x['tvshowid'] in service_ids
         ]
         intermediate.sort(reverse=not sort_reverse)
         return [x[1:] for x in intermediate]
@@ -361,10 +369,10 @@ def merge_and_sort_shows(
     elif sort_by == 4:
         # Sort by Season number
         intermediate = [
-            [int(WINDOW.getProperty("EasyTV.%s.Season" % x['tvshowid']) or 0),
+            [int(get_prop("EasyTV.%s.Season" % x['tvshowid']) or 0),
              parse_lastplayed_date(x['lastplayed']) if x.get('lastplayed') else 0,
              x['tvshowid']]
-            for x in shows_from_query if x['tvshowid'] in shows_from_service
+            for x in shows_from_query if x['tvshowid'] in service_ids
         ]
         intermediate.sort(reverse=not sort_reverse)
         return [x[1:] for x in intermediate]
@@ -374,7 +382,7 @@ def merge_and_sort_shows(
         intermediate = [
             [parse_lastplayed_date(x['lastplayed']) if x.get('lastplayed') else 0,
              x['tvshowid']]
-            for x in shows_from_query if x['tvshowid'] in shows_from_service
+            for x in shows_from_query if x['tvshowid'] in service_ids
         ]
         random.shuffle(intermediate)
         return intermediate
@@ -385,7 +393,7 @@ def merge_and_sort_shows(
             [get_show_duration(x['tvshowid']),
              parse_lastplayed_date(x['lastplayed']) if x.get('lastplayed') else 0,
              x['tvshowid']]
-            for x in shows_from_query if x['tvshowid'] in shows_from_service
+            for x in shows_from_query if x['tvshowid'] in service_ids
         ]
         # Default is descending (longest first); sort_reverse inverts to ascending
         intermediate.sort(reverse=not sort_reverse)
@@ -396,7 +404,7 @@ def merge_and_sort_shows(
         intermediate = [
             [parse_lastplayed_date(x['lastplayed']) if x.get('lastplayed') else 0, 
              x['tvshowid']] 
-            for x in shows_from_query if x['tvshowid'] in shows_from_service
+            for x in shows_from_query if x['tvshowid'] in service_ids
         ]
         
         # Separate never-watched shows (timestamp == 0)
@@ -429,8 +437,8 @@ def sync_show_list_from_shared_db(storage, logger=None):
     if not shows_str:
         return
     try:
-        local_ids = set(int(x) for x in ast.literal_eval(shows_str))
-    except (ValueError, SyntaxError):
+        local_ids = set(int(x) for x in json.loads(shows_str))
+    except ValueError:
         return
 
     try:
@@ -488,7 +496,7 @@ def sync_show_list_from_shared_db(storage, logger=None):
                        count=len(dropped))
 
     # Update the window property
-    WINDOW.setProperty(PROP_SHOWS_WITH_NEXT_EPISODES, str(sorted(updated_ids)))
+    WINDOW.setProperty(PROP_SHOWS_WITH_NEXT_EPISODES, json.dumps(sorted(updated_ids)))
 
 
 def query_unwatched_show_ids() -> Set[int]:
@@ -505,7 +513,7 @@ def query_unwatched_show_ids() -> Set[int]:
     via its no-episodes branch (it does not make this predicate do per-episode
     file checks).
     """
-    result = json_query(get_unwatched_shows_query(), True)
+    result = json_query(serialized_query(get_unwatched_shows_query), True)
     return {s["tvshowid"] for s in result.get("tvshows", [])}
 
 
@@ -562,8 +570,8 @@ def fetch_unwatched_shows(sort_by: int, sort_reverse: bool, language: str = 'Eng
         
         if shows_str:
             try:
-                shows_from_service = [int(x) for x in ast.literal_eval(shows_str)]
-            except (ValueError, SyntaxError) as e:
+                shows_from_service = [int(x) for x in json.loads(shows_str)]
+            except ValueError as e:
                 log.warning("Failed to parse shows_with_next_episodes property",
                             event="data.parse_error", error=str(e))
                 from resources.lib.utils import lang
@@ -584,8 +592,9 @@ def fetch_unwatched_shows(sort_by: int, sort_reverse: bool, language: str = 'Eng
         timer.mark("sort")
         
         # Add episode IDs from service cache
+        get_prop = WINDOW.getProperty
         stored_data = [
-            [x[0], x[1], WINDOW.getProperty("EasyTV.%s.EpisodeID" % x[1])] 
+            [x[0], x[1], get_prop("EasyTV.%s.EpisodeID" % x[1])]
             for x in sorted_shows
         ]
         
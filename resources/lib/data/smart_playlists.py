@@ -405,16 +405,17 @@ def _write_episode_playlists(
         try:
             xbmc.sleep(FILE_WRITE_DELAY_MS)
             
+            # Header, entries sorted by show_id for consistent output, footer;
+            # joined once so the file is written in a single call
+            parts = [config.episode_xml_header(playlist_def.display_name)]
+            parts.extend(
+                config.episode_entry(show_id, filename)
+                for show_id, filename, _ in sorted(entries, key=lambda x: x[0])
+            )
+            parts.append(config.episode_xml_footer)
+            
             with open(playlist_path, 'w', encoding='utf-8') as f:
-                # Write header
-                f.write(config.episode_xml_header(playlist_def.display_name))
-                
-                # Write entries sorted by show_id for consistent output
-                for show_id, filename, _ in sorted(entries, key=lambda x: x[0]):
-                    f.write(config.episode_entry(show_id, filename))
-                
-                # Write footer
-                f.write(config.episode_xml_footer)
+                f.write(''.join(parts))
             
             files_written += 1
             
@@ -464,16 +465,17 @@ def _write_tvshow_playlists(
         try:
             xbmc.sleep(FILE_WRITE_DELAY_MS)
             
+            # Header, entries sorted by show_id for consistent output, footer;
+            # joined once so the file is written in a single call
+            parts = [config.tvshow_xml_header(playlist_def.display_name)]
+            parts.extend(
+                config.tvshow_entry(show_id, title)
+                for show_id, _, title in sorted(entries, key=lambda x: x[0])
+            )
+            parts.append(config.tvshow_xml_footer)
+            
             with open(playlist_path, 'w', encoding='utf-8') as f:
-                # Write header
-                f.write(config.tvshow_xml_header(playlist_def.display_name))
-                
-                # Write entries sorted by show_id for consistent output
-                for show_id, _, title in sorted(entries, key=lambda x: x[0]):
-                    f.write(config.tvshow_entry(show_id, title))
-                
-                # Write footer
-                f.write(config.tvshow_xml_footer)
+                f.write(''.join(parts))
             
             files_written += 1
             
@@ -801,12 +803,13 @@ def _write_show_to_playlist_file(
     config = PLAYLIST_CONFIG
     
     # Determine header, footer, and entry format based on type
+    # (the header is only needed, and only built, when creating the file)
     if playlist_type == 'episode':
-        header = config.episode_xml_header(playlist_name)
+        make_header = config.episode_xml_header
         footer = config.episode_xml_footer
         show_entry = config.episode_entry(show_id, value)
     else:
-        header = config.tvshow_xml_header(playlist_name)
+        make_header = config.tvshow_xml_header
         footer = config.tvshow_xml_footer
         show_entry = config.tvshow_entry(show_id, value)
     
@@ -825,7 +828,7 @@ def _write_show_to_playlist_file(
     action_taken = None
     if not all_lines:
         # Create new file
-        content.append(header)
+        content.append(make_header(playlist_name))
         content.append(show_entry)
         content.append(footer)
         action_taken = 'created'
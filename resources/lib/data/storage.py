@@ -58,7 +58,10 @@ from resources.lib.constants import (
     PROP_SYNC_REV,
     SETTING_MULTI_INSTANCE_SYNC,
 )
-from resources.lib.data.queries import build_episode_details_query
+from resources.lib.data.queries import (
+    build_episode_details_query,
+    build_episode_resume_query,
+)
 from resources.lib.utils import get_bool_setting, get_logger, json_query, lang
 
 log = get_logger('storage')
@@ -736,7 +739,7 @@ class SharedDatabaseStorage(StorageBackend):
             query failed or returned no episode data.
         """
         try:
-            ep_result = json_query(build_episode_details_query(episode_id), True)
+            ep_result = json_query(build_episode_resume_query(episode_id), True)
         except Exception:
             return False  # Query failed, keep existing values
 
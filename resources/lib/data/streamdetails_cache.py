@@ -75,8 +75,8 @@ def get_cache_file_path() -> str:
         cache_dir = xbmcvfs.translatePath(
             f"special://profile/addon_data/{DEFAULT_ADDON_ID}/"
         )
-        if not xbmcvfs.exists(cache_dir):
-            xbmcvfs.mkdirs(cache_dir)
+        # mkdirs already returns early when the folder exists
+        xbmcvfs.mkdirs(cache_dir)
         _cache_file_path = os.path.join(cache_dir, STREAMDETAILS_CACHE_FILENAME)
     return _cache_file_path
 
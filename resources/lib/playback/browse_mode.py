@@ -30,7 +30,7 @@ Logging:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
 
 import xbmc
 import xbmcgui
@@ -51,6 +51,7 @@ from resources.lib.constants import (
 )
 from resources.lib.data.queries import (
     build_add_episode_query,
+    build_jsonrpc_batch,
     build_shows_art_query,
     get_clear_video_playlist_query,
 )
@@ -87,6 +88,46 @@ def _get_log() -> StructuredLogger:
 # Shared window reference for property access
 WINDOW = xbmcgui.Window(KODI_HOME_WINDOW_ID)
 
+# Property name parts for the per-show next-episode number ("s01e05")
+_EPISODE_NO_PREFIX = "EasyTV."
+_EPISODE_NO_SUFFIX = ".EpisodeNo"
+# ord('0') * 11: turns ord(tens) * 10 + ord(ones) into the two-digit value
+_TWO_DIGIT_BIAS = ord('0') * 11
+
+
+def _read_episode_numbers(
+    show_ids: Iterable[int],
+) -> Dict[int, Optional[Tuple[int, int]]]:
+    """
+    Read and parse the EpisodeNo window property for each show once.
+
+    The premiere filter needs the season/episode of every listed show's
+    next episode. Reading them up front means one property read and one
+    parse per show, instead of repeating both inside the filter predicate.
+
+    Args:
+        show_ids: TV show IDs to read.
+
+    Returns:
+        Dict of show_id -> (season, episode), or None when the property is
+        missing or malformed.
+    """
+    get_prop = WINDOW.getProperty
+    episode_numbers: Dict[int, Optional[Tuple[int, int]]] = {}
+    for show_id in show_ids:
+        episode_no = get_prop(
+            _EPISODE_NO_PREFIX + str(show_id) + _EPISODE_NO_SUFFIX)
+        parsed = None
+        if len(episode_no) >= 6:
+            # "sSSeEE": digits at 1-2 (season) and 4-5 (episode)
+            s0, s1, e0, e1 = episode_no[1], episode_no[2], episode_no[4], episode_no[5]
+            if ('0' <= s0 <= '9' and '0' <= s1 <= '9'
+                    and '0' <= e0 <= '9' and '0' <= e1 <= '9'):
+                parsed = (ord(s0) * 10 + ord(s1) - _TWO_DIGIT_BIAS,
+                          ord(e0) * 10 + ord(e1) - _TWO_DIGIT_BIAS)
+        episode_numbers[show_id] = parsed
+    return episode_numbers
+
 
 def _fetch_show_art(logger: 'StructuredLogger') -> None:
     """
@@ -116,6 +157,7 @@ def _fetch_show_art(logger: 'StructuredLogger') -> None:
         shows = result.get('tvshows', [])
 
         # Cache art to window properties
+        set_prop = WINDOW.setProperty
         for show in shows:
             show_id = show.get('tvshowid')
             if show_id is None:
@@ -128,8 +170,8 @@ def _fetch_show_art(logger: 'StructuredLogger') -> None:
 
             # Map Kodi art keys to window property format
             # poster -> Art(tvshow.poster), fanart -> Art(tvshow.fanart)
-            WINDOW.setProperty(f"{prop_prefix}.Art(tvshow.poster)", poster)
-            WINDOW.setProperty(f"{prop_prefix}.Art(tvshow.fanart)", fanart)
+            set_prop(f"{prop_prefix}.Art(tvshow.poster)", poster)
+            set_prop(f"{prop_prefix}.Art(tvshow.fanart)", fanart)
 
             if poster:
                 populated += 1
@@ -244,22 +286,20 @@ def build_episode_list(
                              or config.series_premieres == PREMIERE_SKIP
                              or config.season_premieres == PREMIERE_SKIP)
 
-    def should_include(show_entry):
+    get_prop = WINDOW.getProperty
+
+    def should_include(show_entry, episode_numbers):
         """Check if episode should be included based on premiere settings."""
-        episode_no = WINDOW.getProperty(f"EasyTV.{show_entry[1]}.EpisodeNo")
-        if not episode_no or len(episode_no) < 6:
-            return not only_mode
-        try:
-            season_num = int(episode_no[1:3])
-            episode_num = int(episode_no[4:6])
-        except (ValueError, IndexError):
+        parsed = episode_numbers[show_entry[1]]
+        if parsed is None:
             return not only_mode
+        season_num, episode_num = parsed
 
         is_premiere = (episode_num == 1)
 
         # In-progress premieres are always included (user is actively watching)
         if is_premiere:
-            resume = WINDOW.getProperty(f"EasyTV.{show_entry[1]}.Resume")
+            resume = get_prop(f"EasyTV.{show_entry[1]}.Resume")
             if resume == "true":
                 return True
 
@@ -278,6 +318,19 @@ def build_episode_list(
                 return config.series_premieres != PREMIERE_SKIP
             return config.season_premieres != PREMIERE_SKIP
 
+    def include_non_premieres(show_entry, episode_numbers):
+        """Fast path for both premiere types SKIP: drop E01 unless in progress."""
+        parsed = episode_numbers[show_entry[1]]
+        if parsed is None or parsed[1] != 1:
+            return True
+        return get_prop(f"EasyTV.{show_entry[1]}.Resume") == "true"
+
+    if (config.series_premieres == PREMIERE_SKIP
+            and config.season_premieres == PREMIERE_SKIP):
+        include = include_non_premieres
+    else:
+        include = should_include
+
     def _fetch_data():
         """Fetch, filter, and sort show data from Kodi."""
         show_data = filter_shows_by_population(
@@ -291,7 +344,15 @@ def build_episode_list(
             )
         if needs_premiere_filter:
             before_count = len(show_data)
-            show_data = [x for x in show_data if should_include(x)]
+            episode_numbers = _read_episode_numbers(x[1] for x in show_data)
+            # show_data is always a fresh list from the fetch/duration step,
+            # so compact it in place rather than building a second copy
+            kept = 0
+            for x in show_data:
+                if include(x, episode_numbers):
+                    show_data[kept] = x
+                    kept += 1
+            del show_data[kept:]
             excluded = before_count - len(show_data)
             if excluded:
                 log.debug("Premiere filter applied",
@@ -404,14 +465,15 @@ def build_episode_list(
             
             # Clear and rebuild playlist
             # This approach is needed because .strm files won't start via JSON-RPC
-            json_query(get_clear_video_playlist_query(), False)
-            
-            # Add selected episode(s) to playlist
-            if isinstance(selected, list):
-                for ep in selected:
-                    json_query(build_add_episode_query(int(ep)), False)
-            else:
-                json_query(build_add_episode_query(int(selected)), False)
+            # Clear and add(s) go as one JSON-RPC batch; Kodi runs it in order
+            episode_ids = selected if isinstance(selected, list) else [selected]
+            json_query(
+                build_jsonrpc_batch(
+                    [get_clear_video_playlist_query()]
+                    + [build_add_episode_query(int(ep)) for ep in episode_ids]
+                ),
+                False,
+            )
             
             # Start playback
             xbmc.sleep(PLAYLIST_ADD_DELAY_MS)
@@ -50,8 +50,7 @@ from resources.lib.constants import (
     PROP_RANDOM_ORDER_SHUFFLE,
 )
 from resources.lib.data.queries import (
-    build_add_episode_query,
-    build_add_movie_query,
+    build_add_items_batch_query,
     build_inprogress_episodes_query,
     build_inprogress_movies_query,
     build_random_episodes_query,
@@ -604,10 +603,12 @@ def _sort_partials_for_priority(
         else:
             result.append(f'm{item_id}')
 
-    logger.debug("Sorted partials for priority",
-                 tv_shows=len([x for x in result if x.startswith('t')]),
-                 movies=len([x for x in result if x.startswith('m')]),
-                 episode_map_size=len(partial_episode_map))
+    if logger.debug_enabled:
+        tv_count = sum(1 for x in result if x.startswith('t'))
+        logger.debug("Sorted partials for priority",
+                     tv_shows=tv_count,
+                     movies=len(result) - tv_count,
+                     episode_map_size=len(partial_episode_map))
     return result, partial_episode_map
 
 
@@ -1058,9 +1059,10 @@ def _build_lazy_queue_playlist(
         )
         timer.mark("session_create")
         
-        # Pick initial buffer items
+        # Pick initial buffer items (added to the playlist as one batch)
         items_added = 0
         buffer_target = min(LAZY_QUEUE_BUFFER_SIZE, config.length)
+        buffer_items: List[Tuple[str, int]] = []
         
         while items_added < buffer_target:
             result = session.pick_next_item()
@@ -1071,16 +1073,11 @@ def _build_lazy_queue_playlist(
                           buffer_target=buffer_target)
                 break
             
-            item_type, item_id = result
-            
-            # Add to playlist
-            if item_type == 'episode':
-                json_query(build_add_episode_query(item_id), False)
-            elif item_type == 'movie':
-                json_query(build_add_movie_query(item_id), False)
-            
+            buffer_items.append(result)
             items_added += 1
         
+        if buffer_items:
+            json_query(build_add_items_batch_query(buffer_items), False)
         timer.mark("initial_buffer")
         
         # Save session state for playback monitor to use
@@ -1253,6 +1250,8 @@ def build_random_playlist(
             
             # Fetch movies if enabled, with appropriate limit
             movie_list: List[int] = []
+            # Movie IDs from the movie playlist filter; reused for partials below
+            playlist_movie_ids: Optional[List[int]] = None
             if include_movies:
                 # Calculate movie limit based on content type and chance
                 if config.playlist_content == CONTENT_MOVIES_ONLY:
@@ -1264,7 +1263,6 @@ def build_random_playlist(
                 
                 if movie_limit > 0:
                     # Extract movie IDs from playlist if filter is set
-                    playlist_movie_ids: Optional[List[int]] = None
                     if config.movie_playlist:
                         playlist_movie_ids = extract_movieids_from_playlist(config.movie_playlist)
                         log.debug("Movie playlist filter applied", 
@@ -1326,10 +1324,8 @@ def build_random_playlist(
                     # Find partial movies (if movie partials enabled and we have movies)
                     partial_movies: List[Tuple[str, int]] = []
                     if config.start_partials_movies and movie_list:
-                        # Get movie IDs from playlist filter if set
-                        playlist_movie_ids: Optional[List[int]] = None
-                        if config.movie_playlist:
-                            playlist_movie_ids = extract_movieids_from_playlist(config.movie_playlist)
+                        # movie_list is only non-empty after the fetch above,
+                        # so playlist_movie_ids already holds the playlist filter
                         partial_movies = _find_all_partial_movies(
                             playlist_movie_ids, log
                         )
@@ -1379,6 +1375,8 @@ def build_random_playlist(
         show_target = config.length - movie_target
         movies_added = 0
         shows_added = 0
+        # Playlist adds are sent as one batch once the loop has picked them
+        playlist_items: List[Tuple[str, int]] = []
 
         # Main playlist building loop (batch mode for Unwatched/Watched/Both without multiple_shows)
         # Candidates are ordered: partials first (priority sorted), then shuffled non-partials
@@ -1420,8 +1418,8 @@ def build_random_playlist(
                 if _check_premiere_exclusion(candidate_id, candidate_list, config):
                     continue
                 
-                # Add episode to playlist
-                json_query(build_add_episode_query(episode_id), False)
+                # Queue episode for the playlist
+                playlist_items.append(('episode', episode_id))
                 
                 # Update tracking dict
                 tmp_details = None
@@ -1450,7 +1448,7 @@ def build_random_playlist(
 
             elif candidate_type == 'm':
                 # Movie candidate
-                json_query(build_add_movie_query(candidate_id), False)
+                playlist_items.append(('movie', candidate_id))
                 candidate_list.remove(f'm{candidate_id}')
                 movies_added += 1
                 
@@ -1460,6 +1458,8 @@ def build_random_playlist(
             
             count += 1
         
+        if playlist_items:
+            json_query(build_add_items_batch_query(playlist_items), False)
         outer_timer.mark("playlist_build")
         
         # Notify service that playlist is running
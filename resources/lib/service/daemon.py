@@ -66,6 +66,7 @@ import json
 import os
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union, cast
 
@@ -102,6 +103,8 @@ from resources.lib.constants import (
     PROP_SYNC_PENDING_SHOWS,
     PROP_VERSION,
     SETTING_MULTI_INSTANCE_SYNC,
+    STREAMDETAILS_BATCH_SIZE,
+    STREAMDETAILS_QUERY_WORKERS,
     SYNC_CHECK_INTERVAL_TICKS,
     TARGET_DETECTION_MAX_TICKS,
     TARGET_DETECTION_SLEEP_MS,
@@ -116,10 +119,11 @@ from resources.lib.data.duration_cache import (
 from resources.lib.data.queries import (
     build_all_episodes_no_streamdetails_query,
     build_episode_prompt_info_query,
+    build_multi_show_streamdetails_batch,
     build_show_episodes_query,
-    build_show_episodes_with_streamdetails_query,
     get_shows_by_lastplayed_query,
     get_unwatched_shows_query,
+    serialized_query,
 )
 from resources.lib.data.shows import (
     extract_showids_from_playlist,
@@ -175,6 +179,7 @@ from resources.lib.utils import (
     invalidate_icon_cache,
     is_shared_video_database,
     json_query,
+    json_query_batch,
     lang,
     log_timing,
     runtime_converter,
@@ -942,7 +947,7 @@ class ServiceDaemon:
             )
             self._window.setProperty(
                 PROP_SHOWS_WITH_NEXT_EPISODES,
-                str(self._state.shows_with_next_episodes)
+                json.dumps(self._state.shows_with_next_episodes)
             )
         
         self._update_smartplaylist(show_id, remove=True)
@@ -963,7 +968,7 @@ class ServiceDaemon:
             )
             self._window.setProperty(
                 PROP_SHOWS_WITH_NEXT_EPISODES,
-                str(self._state.shows_with_next_episodes)
+                json.dumps(self._state.shows_with_next_episodes)
             )
     
     def _check_shared_db_sync(self, force: bool = False) -> None:
@@ -1393,7 +1398,7 @@ class ServiceDaemon:
                 return
             
             # Query for shows with unwatched episodes
-            result = json_query(get_unwatched_shows_query(), True)
+            result = json_query(serialized_query(get_unwatched_shows_query), True)
             
             if 'tvshows' in result and len(result['tvshows']) > 0:
                 # Found shows - populate the list
@@ -1436,7 +1441,7 @@ class ServiceDaemon:
         stores their IDs in _all_shows_list.
         """
         with log_timing(self._log, "retrieve_show_ids"):
-            result = json_query(get_unwatched_shows_query(), True)
+            result = json_query(serialized_query(get_unwatched_shows_query), True)
             
             if 'tvshows' not in result:
                 self._all_shows_list = []
@@ -1489,7 +1494,7 @@ class ServiceDaemon:
         
         with timing_ctx as timer:
             # Get shows sorted by last played
-            lshows_result = json_query(get_shows_by_lastplayed_query(), True)
+            lshows_result = json_query(serialized_query(get_shows_by_lastplayed_query), True)
             
             if 'tvshows' not in lshows_result:
                 show_lw = []
@@ -1541,7 +1546,7 @@ class ServiceDaemon:
             episodes_by_show: Dict[int, List[Dict[str, Any]]] = {}
             if bulk and show_lw:
                 showids_set = set(show_lw)
-                all_episodes_result = json_query(build_all_episodes_no_streamdetails_query(), True)
+                all_episodes_result = json_query(serialized_query(build_all_episodes_no_streamdetails_query), True)
                 
                 # Group episodes by show ID
                 for ep in all_episodes_result.get('episodes', []):
@@ -1775,19 +1780,37 @@ class ServiceDaemon:
                 new_durations: Dict[int, int] = {}
                 new_streamdetails: Dict[int, Dict[int, Dict[str, Any]]] = {}
                 if shows_to_query:
-                    for show_id in shows_to_query:
-                        service_heartbeat()
-                        ep_result = json_query(
-                            build_show_episodes_with_streamdetails_query(show_id),
-                            True
-                        )
-                        episodes_with_stream = ep_result.get('episodes', [])
-                        if show_id in shows_needing_calc:
-                            median = calculate_median_duration(episodes_with_stream)
-                            new_durations[show_id] = median
-                        new_streamdetails[show_id] = extract_episode_streamdetails(
-                            episodes_with_stream
+                    def _fetch_streamdetails(
+                        show_ids: List[int]
+                    ) -> List[Tuple[int, List[Dict[str, Any]]]]:
+                        results = json_query_batch(
+                            build_multi_show_streamdetails_batch(show_ids)
                         )
+                        return [
+                            (show_id, result.get('episodes', []))
+                            for show_id, result in zip(show_ids, results)
+                        ]
+
+                    # Each worker fetches a group of shows in one JSON-RPC
+                    # batch and the batches overlap on a small pool; results
+                    # are consumed here, on the service thread, as they arrive
+                    query_ids = list(shows_to_query)
+                    show_groups = [
+                        query_ids[i:i + STREAMDETAILS_BATCH_SIZE]
+                        for i in range(0, len(query_ids), STREAMDETAILS_BATCH_SIZE)
+                    ]
+                    with ThreadPoolExecutor(
+                        max_workers=STREAMDETAILS_QUERY_WORKERS
+                    ) as pool:
+                        for group in pool.map(_fetch_streamdetails, show_groups):
+                            for show_id, episodes_with_stream in group:
+                                service_heartbeat()
+                                if show_id in shows_needing_calc:
+                                    median = calculate_median_duration(episodes_with_stream)
+                                    new_durations[show_id] = median
+                                new_streamdetails[show_id] = extract_episode_streamdetails(
+                                    episodes_with_stream
+                                )
 
                     self._log.debug(
                         "Streamdetails queries complete",
@@ -1805,11 +1828,11 @@ class ServiceDaemon:
                 )
                 
                 # Write all durations to window properties
-                cached_shows = updated_cache.get('shows', {})
+                cached_shows = updated_cache['shows']
                 for show_id in current_episode_counts.keys():
-                    show_id_str = str(show_id)
-                    if show_id_str in cached_shows:
-                        duration = cached_shows[show_id_str].get('median_seconds', 0)
+                    cached_entry = cached_shows.get(str(show_id))
+                    if cached_entry is not None:
+                        duration = cached_entry.get('median_seconds', 0)
                     elif show_id in new_durations:
                         # Show calculated but not cached (median was 0)
                         duration = new_durations[show_id]
@@ -1900,7 +1923,7 @@ class ServiceDaemon:
             # Update window property with tracked shows
             self._window.setProperty(
                 PROP_SHOWS_WITH_NEXT_EPISODES,
-                str(self._state.shows_with_next_episodes)
+                json.dumps(self._state.shows_with_next_episodes)
             )
         
         if not bulk:
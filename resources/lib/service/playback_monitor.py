@@ -50,9 +50,12 @@ from resources.lib.constants import (
 from resources.lib.data.queries import (
     build_add_episode_query,
     build_add_movie_query,
+    build_jsonrpc_batch,
     build_player_seek_query,
     build_player_seek_time_query,
+    get_clear_video_playlist_query,
     get_playing_item_query,
+    serialized_query,
 )
 from resources.lib.data.shows import (
     parse_season_episode_string,
@@ -193,7 +196,7 @@ class PlaybackMonitor(xbmc.Player):
         self._nextprompt_trigger_override = True
         
         # Check what is playing
-        self._ep_details = json_query(get_playing_item_query(), True)
+        self._ep_details = json_query(serialized_query(get_playing_item_query), True)
         self._log.debug("Now playing details", details=self._ep_details)
         
         self._pl_running_local = self._window.getProperty(PROP_PLAYLIST_RUNNING)
@@ -821,11 +824,11 @@ class PlaybackMonitor(xbmc.Player):
             self._window.clearProperty(PROP_PLAYLIST_CONFIG)
             self._window.setProperty(PROP_PLAYLIST_RUNNING, 'false')
             # User chose to play next episode
-            xbmc.executeJSONRPC(
-                '{"jsonrpc": "2.0","id": 1, "method": "Playlist.Clear",'
-                '"params": {"playlistid": 1}}'
-            )
-            json_query(build_add_episode_query(int(pre_epid)), False)
+            # Clear and add in one JSON-RPC batch (executed in order)
+            json_query(build_jsonrpc_batch([
+                get_clear_video_playlist_query(),
+                build_add_episode_query(int(pre_epid)),
+            ]), False)
             xbmc.sleep(PLAYLIST_ADD_DELAY_MS)
             xbmc.Player().play(xbmc.PlayList(1))
             if paused:
@@ -27,7 +27,7 @@ Logging:
 from __future__ import annotations
 
 import ast
-import os
+import json
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
@@ -42,6 +42,8 @@ from resources.lib.utils import (
     get_logger,
     json_query,
     lang,
+    parse_stored_literal,
+    playlist_display_name,
 )
 
 if TYPE_CHECKING:
@@ -102,7 +104,7 @@ def _migrate_show_setting(
             orphaned.append(show_id)
     
     # Save migrated format
-    addon.setSetting(setting_name, str(migrated))
+    addon.setSetting(setting_name, json.dumps(migrated))
     
     logger.info(
         "Migrated show setting to new format",
@@ -287,7 +289,7 @@ def validate_show_selections(
         
         # Save if anything changed
         if orphaned > 0 or migrated > 0 or needs_migration:
-            addon.setSetting('random_order_shows', str(valid_dict))
+            addon.setSetting('random_order_shows', json.dumps(valid_dict))
             settings_changed = True
             
             if orphaned > 0:
@@ -326,7 +328,7 @@ def validate_show_selections(
         
         # Save if anything changed
         if orphaned > 0 or migrated > 0 or needs_migration:
-            addon.setSetting('selection', str(valid_dict))
+            addon.setSetting('selection', json.dumps(valid_dict))
             settings_changed = True
             
             if orphaned > 0:
@@ -460,10 +462,7 @@ def init_display_settings(addon: Optional[xbmcaddon.Addon] = None) -> None:
     # Playlist file display
     playlist_path = setting('user_playlist_path')
     if playlist_path and playlist_path != 'none' and playlist_path != 'empty':
-        filename = os.path.basename(playlist_path)
-        if filename.endswith('.xsp'):
-            filename = filename[:-4]
-        display_text = filename
+        display_text = playlist_display_name(playlist_path)
     else:
         display_text = lang(32570)
     addon.setSetting(id="playlist_file_display", value=display_text)
@@ -474,10 +473,7 @@ def init_display_settings(addon: Optional[xbmcaddon.Addon] = None) -> None:
     # Movie playlist file display
     movie_playlist_path = setting('movie_user_playlist_path')
     if movie_playlist_path and movie_playlist_path != 'none' and movie_playlist_path != 'empty':
-        filename = os.path.basename(movie_playlist_path)
-        if filename.endswith('.xsp'):
-            filename = filename[:-4]
-        display_text = filename
+        display_text = playlist_display_name(movie_playlist_path)
     else:
         display_text = lang(32603)  # "All movies"
     addon.setSetting(id="movie_playlist_file_display", value=display_text)
@@ -615,17 +611,18 @@ def load_settings(
     # Extract list[int] from dict keys for consumers
     settings.random_order_shows = [int(sid) for sid in show_dict.keys()]
     
-    # Get previous random_order_shows from window property
+    # Get previous random_order_shows from window property (empty on first run)
+    raw_random_order_shows = window.getProperty("EasyTV.random_order_shows")
     try:
-        old_random_order_shows = ast.literal_eval(
-            window.getProperty("EasyTV.random_order_shows")
+        old_random_order_shows = (
+            parse_stored_literal(raw_random_order_shows) if raw_random_order_shows else []
         )
     except (ValueError, SyntaxError):
         old_random_order_shows = []
     
     # Update window property immediately to prevent duplicate processing
     # when multiple onSettingsChanged events fire in quick succession
-    window.setProperty("EasyTV.random_order_shows", str(settings.random_order_shows))
+    window.setProperty("EasyTV.random_order_shows", json.dumps(settings.random_order_shows))
     
     # Handle changes to random_order_shows
     if old_random_order_shows != settings.random_order_shows and not firstrun:
@@ -708,7 +705,7 @@ def load_settings(
     settings.selection = [int(sid) for sid in show_dict.keys()]
     
     # Update window property for default.py to read
-    window.setProperty("EasyTV.selection", str(settings.selection))
+    window.setProperty("EasyTV.selection", json.dumps(settings.selection))
     
     log.debug("Selection shows", shows=settings.selection)
     
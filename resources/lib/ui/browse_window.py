@@ -116,7 +116,9 @@ def _clone_row_overrides(
             pass  # Non-numeric cached value; proceed to fetch fresh metadata
 
     details = (
-        json_query(build_episode_details_query(resolved)) or {}
+        json_query(build_episode_details_query(
+            resolved, ('title', 'season', 'episode', 'plot', 'file', 'resume')
+        )) or {}
     ).get('episodedetails')
     if not details:
         return None
@@ -300,24 +302,25 @@ class BrowseWindow(xbmcgui.WindowXMLDialog):
             Configured ListItem for the show
         """
         prop_prefix = f"EasyTV.{show_id}"
+        get_prop = WINDOW.getProperty
 
         # Get episode properties
-        pct_played = WINDOW.getProperty(f"{prop_prefix}.PercentPlayed")
-        poster = WINDOW.getProperty(f"{prop_prefix}.Art(tvshow.poster)")
-        eptitle = WINDOW.getProperty(f"{prop_prefix}.Title")
-        plot = WINDOW.getProperty(f"{prop_prefix}.Plot")
-        season = WINDOW.getProperty(f"{prop_prefix}.Season")
-        episode = WINDOW.getProperty(f"{prop_prefix}.Episode")
-        episode_id = WINDOW.getProperty(f"{prop_prefix}.EpisodeID")
-        file_path = WINDOW.getProperty(f"{prop_prefix}.File")
-        title = WINDOW.getProperty(f"{prop_prefix}.TVshowTitle")
-        fanart = WINDOW.getProperty(f"{prop_prefix}.Art(tvshow.fanart)")
-        ep_no = WINDOW.getProperty(f"{prop_prefix}.EpisodeNo")
-        num_watched = WINDOW.getProperty(f"{prop_prefix}.CountWatchedEps")
-        num_ondeck = WINDOW.getProperty(f"{prop_prefix}.CountonDeckEps")
-        genre = WINDOW.getProperty(f"{prop_prefix}.Genre")
-        duration_secs = WINDOW.getProperty(f"{prop_prefix}.Duration")
-        ep_runtime = WINDOW.getProperty(f"{prop_prefix}.EpRuntime")
+        pct_played = get_prop(f"{prop_prefix}.PercentPlayed")
+        poster = get_prop(f"{prop_prefix}.Art(tvshow.poster)")
+        eptitle = get_prop(f"{prop_prefix}.Title")
+        plot = get_prop(f"{prop_prefix}.Plot")
+        season = get_prop(f"{prop_prefix}.Season")
+        episode = get_prop(f"{prop_prefix}.Episode")
+        episode_id = get_prop(f"{prop_prefix}.EpisodeID")
+        file_path = get_prop(f"{prop_prefix}.File")
+        title = get_prop(f"{prop_prefix}.TVshowTitle")
+        fanart = get_prop(f"{prop_prefix}.Art(tvshow.fanart)")
+        ep_no = get_prop(f"{prop_prefix}.EpisodeNo")
+        num_watched = get_prop(f"{prop_prefix}.CountWatchedEps")
+        num_ondeck = get_prop(f"{prop_prefix}.CountonDeckEps")
+        genre = get_prop(f"{prop_prefix}.Genre")
+        duration_secs = get_prop(f"{prop_prefix}.Duration")
+        ep_runtime = get_prop(f"{prop_prefix}.EpRuntime")
 
         # For clones: override episode fields if the local random-order pick
         # diverges from the shared cached pick (no shared prop writes).
@@ -349,7 +352,7 @@ class BrowseWindow(xbmcgui.WindowXMLDialog):
 
         # Calculate skipped episodes
         try:
-            num_unwatched = int(WINDOW.getProperty(f"{prop_prefix}.CountUnwatchedEps"))
+            num_unwatched = int(get_prop(f"{prop_prefix}.CountUnwatchedEps"))
             num_ondeck_int = int(num_ondeck) if num_ondeck else 0
             num_skipped = str(num_unwatched - num_ondeck_int)
         except ValueError:
@@ -377,16 +380,15 @@ class BrowseWindow(xbmcgui.WindowXMLDialog):
         info_tag.setTitle(eptitle)
 
         # Additional InfoTagVideo fields from service window properties
-        year_str = WINDOW.getProperty(f"{prop_prefix}.Year")
+        year_str = get_prop(f"{prop_prefix}.Year")
         if year_str:
             try:
                 info_tag.setYear(int(year_str))
             except ValueError:
                 pass
 
-        genre_str = WINDOW.getProperty(f"{prop_prefix}.Genre")
-        if genre_str:
-            info_tag.setGenres([g.strip() for g in genre_str.split(',')])
+        if genre:
+            info_tag.setGenres([g.strip() for g in genre.split(',')])
 
         display_duration = ep_runtime or duration_secs
         if display_duration:
@@ -400,20 +402,21 @@ class BrowseWindow(xbmcgui.WindowXMLDialog):
     def _update_list_item(self, item: xbmcgui.ListItem, show_id: int) -> None:
         """Update a list item in-place from current window properties."""
         prop_prefix = f"EasyTV.{show_id}"
+        get_prop = WINDOW.getProperty
 
         # Re-read all properties from the daemon's updated cache
-        pct_played = WINDOW.getProperty(f"{prop_prefix}.PercentPlayed")
-        poster = WINDOW.getProperty(f"{prop_prefix}.Art(tvshow.poster)")
-        eptitle = WINDOW.getProperty(f"{prop_prefix}.Title")
-        plot = WINDOW.getProperty(f"{prop_prefix}.Plot")
-        season = WINDOW.getProperty(f"{prop_prefix}.Season")
-        episode = WINDOW.getProperty(f"{prop_prefix}.Episode")
-        episode_id = WINDOW.getProperty(f"{prop_prefix}.EpisodeID")
-        file_path = WINDOW.getProperty(f"{prop_prefix}.File")
-        fanart = WINDOW.getProperty(f"{prop_prefix}.Art(tvshow.fanart)")
-        ep_no = WINDOW.getProperty(f"{prop_prefix}.EpisodeNo")
-        num_watched = WINDOW.getProperty(f"{prop_prefix}.CountWatchedEps")
-        num_ondeck = WINDOW.getProperty(f"{prop_prefix}.CountonDeckEps")
+        pct_played = get_prop(f"{prop_prefix}.PercentPlayed")
+        poster = get_prop(f"{prop_prefix}.Art(tvshow.poster)")
+        eptitle = get_prop(f"{prop_prefix}.Title")
+        plot = get_prop(f"{prop_prefix}.Plot")
+        season = get_prop(f"{prop_prefix}.Season")
+        episode = get_prop(f"{prop_prefix}.Episode")
+        episode_id = get_prop(f"{prop_prefix}.EpisodeID")
+        file_path = get_prop(f"{prop_prefix}.File")
+        fanart = get_prop(f"{prop_prefix}.Art(tvshow.fanart)")
+        ep_no = get_prop(f"{prop_prefix}.EpisodeNo")
+        num_watched = get_prop(f"{prop_prefix}.CountWatchedEps")
+        num_ondeck = get_prop(f"{prop_prefix}.CountonDeckEps")
 
         # For clones: override episode fields if the local random-order pick
         # diverges from the shared cached pick (no shared prop writes).
@@ -431,15 +434,15 @@ class BrowseWindow(xbmcgui.WindowXMLDialog):
 
         # Calculate skipped episodes
         try:
-            num_unwatched = int(WINDOW.getProperty(f"{prop_prefix}.CountUnwatchedEps"))
+            num_unwatched = int(get_prop(f"{prop_prefix}.CountUnwatchedEps"))
             num_ondeck_int = int(num_ondeck) if num_ondeck else 0
             num_skipped = str(num_unwatched - num_ondeck_int)
         except ValueError:
             num_skipped = '0'
 
-        genre = WINDOW.getProperty(f"{prop_prefix}.Genre")
-        duration_secs = WINDOW.getProperty(f"{prop_prefix}.Duration")
-        ep_runtime = WINDOW.getProperty(f"{prop_prefix}.EpRuntime")
+        genre = get_prop(f"{prop_prefix}.Genre")
+        duration_secs = get_prop(f"{prop_prefix}.Duration")
+        ep_runtime = get_prop(f"{prop_prefix}.EpRuntime")
 
         # Update the item in-place
         item.setLabel2(eptitle)
@@ -462,16 +465,15 @@ class BrowseWindow(xbmcgui.WindowXMLDialog):
         info_tag.setTitle(eptitle)
 
         # Additional InfoTagVideo fields from service window properties
-        year_str = WINDOW.getProperty(f"{prop_prefix}.Year")
+        year_str = get_prop(f"{prop_prefix}.Year")
         if year_str:
             try:
                 info_tag.setYear(int(year_str))
             except ValueError:
                 pass
 
-        genre_str = WINDOW.getProperty(f"{prop_prefix}.Genre")
-        if genre_str:
-            info_tag.setGenres([g.strip() for g in genre_str.split(',')])
+        if genre:
+            info_tag.setGenres([g.strip() for g in genre.split(',')])
 
         display_duration = ep_runtime or duration_secs
         if display_duration:
@@ -26,10 +26,9 @@ Logging:
 
 import os
 import sys
-from typing import List
+from typing import Any, Dict, List, Optional
 
 import xbmc
-import xbmcaddon
 import xbmcgui
 import xbmcvfs
 
@@ -41,20 +40,14 @@ from resources.lib.constants import (
     PROP_SERVICE_PATH,
     PROP_SERVICE_RUNNING,
     PROP_VERSION,
-    SERVICE_POLL_SLEEP_MS,
-    SERVICE_POLL_TIMEOUT_TICKS,
+    SERVICE_POLL_BACKOFF_MS,
+    SERVICE_POLL_TIMEOUT_MS,
     SETTING_MULTI_INSTANCE_SYNC,
 )
-from resources.lib.playback.browse_mode import EpisodeListConfig, build_episode_list
-from resources.lib.playback.random_player import (
-    RandomPlaylistConfig,
-    build_random_playlist,
-)
-from resources.lib.ui.dialogs import show_confirm, show_playlist_selection
+from resources.lib.ui.dialogs import show_confirm
 from resources.lib.utils import (
-    compare_versions,
+    get_addon,
     get_bool_setting,
-    get_int_setting,
     get_logger,
     is_clone,
     lang,
@@ -63,6 +56,47 @@ from resources.lib.utils import (
     restart_addon,
 )
 
+# Home window and dialog handles, created on first use and shared by the
+# entry-point helpers instead of constructing new Kodi objects in each one
+_window: Optional[xbmcgui.Window] = None
+_dialog: Optional[xbmcgui.Dialog] = None
+
+
+def _get_window() -> xbmcgui.Window:
+    """Get or create the shared home window handle."""
+    global _window
+    if _window is None:
+        _window = xbmcgui.Window(KODI_HOME_WINDOW_ID)
+    return _window
+
+
+def _get_dialog() -> xbmcgui.Dialog:
+    """Get or create the shared dialog handle."""
+    global _dialog
+    if _dialog is None:
+        _dialog = xbmcgui.Dialog()
+    return _dialog
+
+
+# Localized strings fetched so far, keyed by strings.po ID
+_msgs: Dict[int, str] = {}
+
+
+def _msg(string_id: int) -> str:
+    """Return lang(string_id), fetching each ID from Kodi at most once."""
+    text = _msgs.get(string_id)
+    if text is None:
+        text = _msgs[string_id] = lang(string_id)
+    return text
+
+
+def _require_playlist(path, missing_msg_id, log_message, dialog, log, addon_name):
+    """Exit with a dialog if the configured playlist file is missing."""
+    if not xbmcvfs.exists(path):
+        log.warning(log_message, event="playlist.missing", path=path)
+        dialog.ok(addon_name, _msg(missing_msg_id))
+        sys.exit()
+
 
 def _get_population(filter_enabled, populate_by, playlist_source,
                     user_playlist_path, selected_shows, dialog, log,
@@ -73,37 +107,119 @@ def _get_population(filter_enabled, populate_by, playlist_source,
     if populate_by == '1':
         if playlist_source == '0':
             # Ask each time - pass tvshows filter for TV show playlists
+            from resources.lib.ui.dialogs import show_playlist_selection
             return {'playlist': show_playlist_selection(
                 dialog=dialog, logger=log, playlist_type='tvshows'
             )}
         # Use default playlist - check file exists first
         if user_playlist_path and user_playlist_path != 'none':
-            if not xbmcvfs.exists(user_playlist_path):
-                log.warning("TV show playlist file not found",
-                           event="playlist.missing", path=user_playlist_path)
-                # 32607 = "TV show playlist not found. Please update your settings."
-                dialog.ok(addon_name, lang(32607))
-                sys.exit()
+            # 32607 = "TV show playlist not found. Please update your settings."
+            _require_playlist(user_playlist_path, 32607,
+                              "TV show playlist file not found", dialog, log, addon_name)
             return {'playlist': user_playlist_path}
         return {'none': ''}
     return {'usersel': selected_shows}
 
 
-def _get_skin_setting(addon):
-    """Get skin style setting, handling legacy values."""
-    view_style = addon.getSetting('view_style')
-    if view_style == 'true':
-        addon.setSetting('view_style', '1')
-        return 1
-    if view_style in ('false', '32073'):
+# Legacy view_style values -> skin style used for this launch. Any legacy
+# value is rewritten to the current default ('1') on first read.
+_LEGACY_VIEW_STYLES = {'true': 1, 'false': 0, '32073': 0}
+
+
+def _get_skin_setting(addon, view_style=None):
+    """Get skin style setting, handling legacy values.
+
+    view_style may be passed from a settings snapshot; otherwise it is read.
+    """
+    if view_style is None:
+        view_style = addon.getSetting('view_style')
+    legacy = _LEGACY_VIEW_STYLES.get(view_style)
+    if legacy is not None:
         addon.setSetting('view_style', '1')
-        return 0
+        return legacy
     try:
         return int(view_style)
     except (ValueError, TypeError):
         return 0
 
 
+# Settings read by main_entry, grouped by the branch that needs them
+_COMMON_SETTING_KEYS = (
+    'primary_function', 'filter_enabled', 'sort_by', 'sort_reverse',
+    'populate_by', 'playlist_source', 'user_playlist_path',
+    'duration_filter_enabled', 'duration_min', 'duration_max',
+    'premieres', 'season_premieres',
+)
+_RANDOM_SETTING_KEYS = (
+    'playlist_content', 'movie_user_playlist_path', 'length',
+    'episode_selection', 'movie_selection', 'movie_chance',
+    'start_partials_tv', 'start_partials_movies', 'multiple_shows',
+    'unwatched_ratio',
+)
+_BROWSE_SETTING_KEYS = (
+    'limit_shows', 'window_length', 'skin_return', 'excl_random_order_shows',
+    'view_style',
+)
+
+
+def _snapshot_settings(addon, keys, into=None):
+    """Read each setting in keys once into a dict (optionally extending into)."""
+    settings = {} if into is None else into
+    get = addon.getSetting
+    for key in keys:
+        settings[key] = get(key)
+    return settings
+
+
+def _as_bool(settings, key):
+    """Parse a snapshot value like get_bool_setting."""
+    return settings[key] == 'true'
+
+
+def _as_int(settings, key, default=0):
+    """Parse a snapshot value like get_int_setting."""
+    try:
+        return int(float(settings[key]))
+    except (ValueError, TypeError):
+        return default
+
+
+# Config field -> (setting id, parser) for the settings-backed fields of
+# RandomPlaylistConfig and EpisodeListConfig; the remaining fields are
+# runtime values passed explicitly in main_entry
+_RANDOM_CONFIG_SPEC = (
+    ('length', 'length', _as_int),
+    ('episode_selection', 'episode_selection', _as_int),
+    ('movie_selection', 'movie_selection', _as_int),
+    ('movie_chance', 'movie_chance', _as_int),
+    ('start_partials_tv', 'start_partials_tv', _as_bool),
+    ('start_partials_movies', 'start_partials_movies', _as_bool),
+    ('premieres', 'premieres', _as_int),
+    ('season_premieres', 'season_premieres', _as_int),
+    ('multiple_shows', 'multiple_shows', _as_bool),
+    ('unwatched_ratio', 'unwatched_ratio', _as_int),
+    ('duration_filter_enabled', 'duration_filter_enabled', _as_bool),
+    ('duration_min', 'duration_min', _as_int),
+    ('duration_max', 'duration_max', _as_int),
+)
+_BROWSE_CONFIG_SPEC = (
+    ('limit_shows', 'limit_shows', _as_bool),
+    ('window_length', 'window_length', _as_int),
+    ('skin_return', 'skin_return', _as_bool),
+    ('excl_random_order_shows', 'excl_random_order_shows', _as_bool),
+    ('duration_filter_enabled', 'duration_filter_enabled', _as_bool),
+    ('duration_min', 'duration_min', _as_int),
+    ('duration_max', 'duration_max', _as_int),
+    ('series_premieres', 'premieres', _as_int),
+    ('season_premieres', 'season_premieres', _as_int),
+)
+
+
+def _config_kwargs(settings, spec) -> Dict[str, Any]:
+    """Build config keyword arguments from a settings snapshot and a spec."""
+    return {field: parse(settings, key) for field, key, parse in spec}
+
+
 def _signal_force_sync_on_open(window):
     """Signal the service to run an immediate shared-DB sync (on-open trigger).
 
@@ -116,7 +232,7 @@ def _signal_force_sync_on_open(window):
         window.setProperty(PROP_FORCE_SYNC, '1')
 
 
-def _read_selected_shows(addon) -> List[int]:
+def _read_selected_shows(addon, window=None) -> List[int]:
     """Return the show-filter selection for this addon instance.
 
     Clones read their own 'selection' setting; the main addon reads the
@@ -126,13 +242,13 @@ def _read_selected_shows(addon) -> List[int]:
     if is_clone(addon):
         return parse_show_id_list(addon.getSetting('selection'))
     try:
-        raw = xbmcgui.Window(KODI_HOME_WINDOW_ID).getProperty("EasyTV.selection")
+        raw = (window or _get_window()).getProperty("EasyTV.selection")
         return parse_show_id_list(raw)
     except (ValueError, SyntaxError):
         return []
 
 
-def _read_random_order_shows(addon) -> List[int]:
+def _read_random_order_shows(addon, window=None) -> List[int]:
     """Return the random-order show list for this addon instance.
 
     Clones read their own 'random_order_shows' setting; the main addon
@@ -142,7 +258,7 @@ def _read_random_order_shows(addon) -> List[int]:
     if is_clone(addon):
         return parse_show_id_list(addon.getSetting('random_order_shows'))
     try:
-        raw = xbmcgui.Window(KODI_HOME_WINDOW_ID).getProperty("EasyTV.random_order_shows")
+        raw = (window or _get_window()).getProperty("EasyTV.random_order_shows")
         return parse_show_id_list(raw)
     except (ValueError, SyntaxError):
         return []
@@ -152,13 +268,16 @@ def main_entry(addon, log):
     """Main entry point - determines mode and launches appropriate functionality."""
     log.debug("Main entry point")
 
-    dialog = xbmcgui.Dialog()
-    window = xbmcgui.Window(KODI_HOME_WINDOW_ID)
-    script_path = addon.getAddonInfo('path')
-    addon_name = addon.getAddonInfo('name')
+    dialog = _get_dialog()
+    window = _get_window()
+    info = addon.getAddonInfo
+    script_path = info('path')
+    addon_name = info('name')
+    addon_id = info('id')
+    clone_mode = is_clone(addon)
 
     # Track which addon (main or clone) started playback for service dialogs
-    window.setProperty('EasyTV.SourceAddonId', addon.getAddonInfo('id'))
+    window.setProperty('EasyTV.SourceAddonId', addon_id)
 
     # On-open trigger: ask the service to sync now so cross-instance changes
     # appear immediately instead of waiting for the next periodic tick.
@@ -170,26 +289,26 @@ def main_entry(addon, log):
     # only runs once per addon launch.
     window.clearProperty(PROP_ART_FETCHED)
 
-    # Load settings
-    primary_function = addon.getSetting('primary_function')
-    filter_enabled = get_bool_setting('filter_enabled')
-    sort_by = get_int_setting('sort_by')
-    sort_reverse = get_bool_setting('sort_reverse')
+    # Load settings (one read per key; branch-specific keys are added below)
+    settings = _snapshot_settings(addon, _COMMON_SETTING_KEYS)
+    primary_function = settings['primary_function']
+    sort_by = _as_int(settings, 'sort_by')
+    sort_reverse = _as_bool(settings, 'sort_reverse')
 
-    selected_shows = _read_selected_shows(addon)
+    selected_shows = _read_selected_shows(addon, window)
 
-    random_order_shows = _read_random_order_shows(addon)
+    random_order_shows = _read_random_order_shows(addon, window)
 
     population = _get_population(
-        filter_enabled, addon.getSetting('populate_by'),
-        addon.getSetting('playlist_source'), addon.getSetting('user_playlist_path'),
+        _as_bool(settings, 'filter_enabled'), settings['populate_by'],
+        settings['playlist_source'], settings['user_playlist_path'],
         selected_shows, dialog, log, addon_name=addon_name
     )
 
     # Determine mode: 0=browse, 1=random playlist, 2=ask
     if primary_function == '2':
-        choice = show_confirm(addon_name, lang(32100) + '\n\n' + lang(32101),
-                              yes_label=lang(32103), no_label=lang(32102))
+        choice = show_confirm(addon_name, _msg(32100) + '\n\n' + _msg(32101),
+                              yes_label=_msg(32103), no_label=_msg(32102))
         # show_confirm returns bool: True=yes(surprise me), False=no(show me)
     else:
         choice = int(primary_function) if primary_function in ('0', '1') else 0
@@ -198,75 +317,80 @@ def main_entry(addon, log):
 
     if choice == 1:
         # Random playlist mode
-        playlist_content = get_int_setting('playlist_content')
+        from resources.lib.playback.random_player import (
+            RandomPlaylistConfig,
+            build_random_playlist,
+        )
+        _snapshot_settings(addon, _RANDOM_SETTING_KEYS, into=settings)
+        playlist_content = _as_int(settings, 'playlist_content')
 
         # Get movie playlist setting if movies are included
         movie_playlist = None
         # playlist_content: 0=TV only, 1=mixed, 2=movies only
         if playlist_content != 0:  # Not TV-only mode
-            movie_playlist_path = addon.getSetting('movie_user_playlist_path')
+            movie_playlist_path = settings['movie_user_playlist_path']
             if movie_playlist_path and movie_playlist_path not in ('none', 'empty', ''):
-                # Check file exists
-                if not xbmcvfs.exists(movie_playlist_path):
-                    log.warning("Movie playlist file not found",
-                               event="playlist.missing", path=movie_playlist_path)
-                    # 32606 = "Movie playlist not found. Please update your settings."
-                    dialog.ok(addon_name, lang(32606))
-                    sys.exit()
+                # 32606 = "Movie playlist not found. Please update your settings."
+                _require_playlist(movie_playlist_path, 32606,
+                                  "Movie playlist file not found", dialog, log, addon_name)
                 movie_playlist = movie_playlist_path
 
         build_random_playlist(
             population=population,
             random_order_shows=random_order_shows,
             config=RandomPlaylistConfig(
-                length=get_int_setting('length'),
                 playlist_content=playlist_content,
-                episode_selection=get_int_setting('episode_selection'),
-                movie_selection=get_int_setting('movie_selection'),
-                movie_chance=get_int_setting('movie_chance'),
-                start_partials_tv=get_bool_setting('start_partials_tv'),
-                start_partials_movies=get_bool_setting('start_partials_movies'),
-                premieres=get_int_setting('premieres'),
-                season_premieres=get_int_setting('season_premieres'),
-                multiple_shows=get_bool_setting('multiple_shows'),
                 sort_by=sort_by, sort_reverse=sort_reverse, language=language,
                 movie_playlist=movie_playlist,
-                unwatched_ratio=get_int_setting('unwatched_ratio'),
-                duration_filter_enabled=get_bool_setting('duration_filter_enabled'),
-                duration_min=get_int_setting('duration_min'),
-                duration_max=get_int_setting('duration_max')
+                **_config_kwargs(settings, _RANDOM_CONFIG_SPEC)
             ),
             logger=log,
-            addon_id=addon.getAddonInfo('id'),
-            clone_mode=is_clone(addon),
+            addon_id=addon_id,
+            clone_mode=clone_mode,
         )
     else:
         # Browse mode - data fetching and filtering handled internally by build_episode_list
+        from resources.lib.playback.browse_mode import (
+            EpisodeListConfig,
+            build_episode_list,
+        )
+        _snapshot_settings(addon, _BROWSE_SETTING_KEYS, into=settings)
         build_episode_list(
             population=population,
             random_order_shows=random_order_shows,
             config=EpisodeListConfig(
-                skin=_get_skin_setting(addon),
-                limit_shows=get_bool_setting('limit_shows'),
-                window_length=get_int_setting('window_length'),
-                skin_return=get_bool_setting('skin_return'),
-                excl_random_order_shows=get_bool_setting('excl_random_order_shows'),
+                skin=_get_skin_setting(addon, settings['view_style']),
                 script_path=script_path,
-                duration_filter_enabled=get_bool_setting('duration_filter_enabled'),
-                duration_min=get_int_setting('duration_min'),
-                duration_max=get_int_setting('duration_max'),
                 sort_by=sort_by,
                 sort_reverse=sort_reverse,
                 language=language,
-                series_premieres=get_int_setting('premieres'),
-                season_premieres=get_int_setting('season_premieres'),
-                clone_mode=is_clone(addon),
+                clone_mode=clone_mode,
+                **_config_kwargs(settings, _BROWSE_CONFIG_SPEC)
             ),
             monitor=xbmc.Monitor(),
             logger=log
         )
 
 
+# Builtins used to reopen the settings dialog after a settings action
+_CLOSE_ALL_DIALOGS = 'Dialog.Close(all,true)'
+_REOPEN_SETTINGS_ALARM = 'AlarmClock(EasyTVSettings,Addon.OpenSettings({addon_id}),00:01,silent)'
+# Icon-change confirmation toast and the clone update launcher
+_ICON_NOTIFICATION = 'Notification({name},{message},3000,{icon})'
+_RUN_UPDATE_CLONE = 'RunScript({script},{service_path},{clone_path},{addon_id},{name})'
+
+
+def _reopen_settings(addon_id):
+    """Close lingering dialogs and reopen the addon settings fresh.
+
+    Force-closing avoids a stale settings dialog instance; the AlarmClock
+    reopens settings after a short delay (00:01 is MM:SS). The addon's own
+    ID is used so clones reopen their own settings, not the main addon's.
+    """
+    xbmc.executebuiltin(_CLOSE_ALL_DIALOGS)
+    xbmc.executebuiltin(_REOPEN_SETTINGS_ALARM.format(addon_id=addon_id))
+
+
 def _handle_special_modes(mode, addon, log, addon_name='EasyTV'):
     """Handle special invocation modes (from settings actions)."""
     if mode == 'playlist':
@@ -276,30 +400,14 @@ def _handle_special_modes(mode, addon, log, addon_name='EasyTV'):
         from resources import playlists
         playlists.Main(playlist_type)
 
-        # Force-close any lingering dialog instances to prevent stale cache
-        # Then reopen settings as a fresh instance after a short delay
-        # Note: Using 00:01 (MM:SS) format for AlarmClock compatibility
-        # Use addon's own ID so clones reopen their own settings, not main addon's
-        addon_id = addon.getAddonInfo('id')
-        xbmc.executebuiltin('Dialog.Close(all,true)')
-        xbmc.executebuiltin(
-            f'AlarmClock(EasyTVSettings,Addon.OpenSettings({addon_id}),00:01,silent)'
-        )
+        _reopen_settings(addon.getAddonInfo('id'))
 
     elif mode == 'selector':
         log.debug("Selector mode")
         from resources import selector
         selector.Main()
 
-        # Force-close any lingering dialog instances to prevent stale cache
-        # Then reopen settings as a fresh instance after a short delay
-        # Note: Using 00:01 (MM:SS) format for AlarmClock compatibility
-        # Use addon's own ID so clones reopen their own settings, not main addon's
-        addon_id = addon.getAddonInfo('id')
-        xbmc.executebuiltin('Dialog.Close(all,true)')
-        xbmc.executebuiltin(
-            f'AlarmClock(EasyTVSettings,Addon.OpenSettings({addon_id}),00:01,silent)'
-        )
+        _reopen_settings(addon.getAddonInfo('id'))
 
     elif mode == 'clone':
         log.debug("Clone creation mode")
@@ -317,16 +425,10 @@ def _handle_special_modes(mode, addon, log, addon_name='EasyTV'):
         addon_id = addon.getAddonInfo('id')
         if set_custom_icon(addon_id):
             invalidate_icon_cache(addon_id)
-            xbmc.executebuiltin(
-                'Notification(%s,%s,%i,%s)' % (
-                    addon_name, lang(32740), 3000,
-                    os.path.join(addon.getAddonInfo('path'), 'icon.png')
-                )
-            )
-        xbmc.executebuiltin('Dialog.Close(all,true)')
-        xbmc.executebuiltin(
-            f'AlarmClock(EasyTVSettings,Addon.OpenSettings({addon_id}),00:01,silent)'
-        )
+            xbmc.executebuiltin(_ICON_NOTIFICATION.format(
+                name=addon_name, message=_msg(32740),
+                icon=os.path.join(addon.getAddonInfo('path'), 'icon.png')))
+        _reopen_settings(addon_id)
 
     elif mode == 'reset_icon':
         log.debug("Reset icon mode")
@@ -334,16 +436,10 @@ def _handle_special_modes(mode, addon, log, addon_name='EasyTV'):
         addon_id = addon.getAddonInfo('id')
         if reset_icon(addon_id):
             invalidate_icon_cache(addon_id)
-            xbmc.executebuiltin(
-                'Notification(%s,%s,%i,%s)' % (
-                    addon_name, lang(32741), 3000,
-                    os.path.join(addon.getAddonInfo('path'), 'icon.png')
-                )
-            )
-        xbmc.executebuiltin('Dialog.Close(all,true)')
-        xbmc.executebuiltin(
-            f'AlarmClock(EasyTVSettings,Addon.OpenSettings({addon_id}),00:01,silent)'
-        )
+            xbmc.executebuiltin(_ICON_NOTIFICATION.format(
+                name=addon_name, message=_msg(32741),
+                icon=os.path.join(addon.getAddonInfo('path'), 'icon.png')))
+        _reopen_settings(addon_id)
 
     elif mode == 'clear_sync_data':
         log.debug("Clear sync data mode")
@@ -363,21 +459,33 @@ def _handle_special_modes(mode, addon, log, addon_name='EasyTV'):
 
 
 def _check_service_running(window):
-    """Check if EasyTV service is running. Returns True if running."""
+    """Check if EasyTV service is running. Returns True if running.
+
+    Posts 'marco' and waits for the service to answer 'polo'. Polls with
+    escalating sleeps (SERVICE_POLL_BACKOFF_MS, then its last step) so the
+    common already-running case returns quickly without a fixed poll floor,
+    while a missing service still gives up after SERVICE_POLL_TIMEOUT_MS.
+    """
     window.setProperty(PROP_SERVICE_RUNNING, 'marco')
-    count = 0
+    waited = 0
+    step = 0
     while window.getProperty(PROP_SERVICE_RUNNING) == 'marco':
-        count += 1
-        if count > SERVICE_POLL_TIMEOUT_TICKS:
+        if waited >= SERVICE_POLL_TIMEOUT_MS:
             return False
-        xbmc.sleep(SERVICE_POLL_SLEEP_MS)
+        sleep_ms = SERVICE_POLL_BACKOFF_MS[min(step, len(SERVICE_POLL_BACKOFF_MS) - 1)]
+        xbmc.sleep(sleep_ms)
+        waited += sleep_ms
+        step += 1
     return True
 
 
 def _handle_version_mismatch(addon_version, addon_version_str, addon_id, script_path, script_name, window, dialog, log):
     """Check version compatibility. Returns True if OK to proceed."""
+    service_version_str = window.getProperty(PROP_VERSION)
+    if service_version_str == addon_version_str:
+        # Common case: identical versions need neither parsing nor checks
+        return True
     try:
-        service_version_str = window.getProperty(PROP_VERSION)
         if not service_version_str:
             service_version = (0, 0, 0, 0, 0)
             service_version_str = "0.0.0"
@@ -390,11 +498,11 @@ def _handle_version_mismatch(addon_version, addon_version_str, addon_id, script_
     if addon_version != service_version and addon_id == "script.easytv":
         log.warning("Version mismatch", event="version.mismatch",
                     addon_version=addon_version_str, service_version=service_version_str)
-        dialog.ok(script_name, lang(32108))
+        dialog.ok(script_name, _msg(32108))
         return False
 
-    # Check if clone is older than service (compare_versions returns -1 if v1 < v2)
-    if compare_versions(addon_version_str, service_version_str) < 0 and addon_id != "script.easytv":
+    # Check if clone is older than service (both already parsed to comparable tuples)
+    if addon_version < service_version and addon_id != "script.easytv":
         # Check if we just completed an update - Kodi's addon cache may still report old version
         # Flag contains the target version we updated to, so we can detect if another update
         # happened after the flag was set (service moved past the flagged version)
@@ -418,17 +526,16 @@ def _handle_version_mismatch(addon_version, addon_version_str, addon_id, script_
 
         log.warning("Clone addon out of date", event="clone.outdated",
                     clone_version=addon_version_str, service_version=service_version_str)
-        message = lang(32110) + '\n' + lang(32111) + '\n\n' + lang(32153)
+        message = _msg(32110) + '\n' + _msg(32111) + '\n\n' + _msg(32153)
         if show_confirm(script_name, message,
-                        yes_label=lang(32109), no_label=lang(32734)):
+                        yes_label=_msg(32109), no_label=_msg(32734)):
             # Use main addon's update_clone.py, not the clone's old version
             # This ensures clones get the latest update logic (e.g., fixed settings replacement)
             service_path = window.getProperty(PROP_SERVICE_PATH)
             update_script = os.path.join(service_path, 'resources', 'update_clone.py')
-            xbmc.executebuiltin(
-                f'RunScript({update_script},{service_path},'
-                f'{script_path},{addon_id},{script_name})'
-            )
+            xbmc.executebuiltin(_RUN_UPDATE_CLONE.format(
+                script=update_script, service_path=service_path,
+                clone_path=script_path, addon_id=addon_id, name=script_name))
         return False
     return True
 
@@ -436,12 +543,14 @@ def _handle_version_mismatch(addon_version, addon_version_str, addon_id, script_
 def main() -> None:
     """UI entry point — called from default.py."""
     try:
-        addon = xbmcaddon.Addon()
-        addon_version_str = addon.getAddonInfo('version')
+        # Shared with lang()/get_bool_setting(), so one Addon serves the launch
+        addon = get_addon()
+        info = addon.getAddonInfo
+        addon_version_str = info('version')
         addon_version = parse_version(addon_version_str)
-        addon_id = addon.getAddonInfo('id')
-        script_path = addon.getAddonInfo('path')
-        script_name = addon.getAddonInfo('Name')
+        addon_id = info('id')
+        script_path = info('path')
+        script_name = info('Name')
 
         log = get_logger('default')
         log.info("EasyTV addon started", event="ui.start", addon_id=addon_id, version=addon_version_str)
@@ -451,17 +560,17 @@ def main() -> None:
             _handle_special_modes(sys.argv[1], addon, log, addon_name=script_name)
             sys.exit()
 
-        window = xbmcgui.Window(KODI_HOME_WINDOW_ID)
-        dialog = xbmcgui.Dialog()
+        window = _get_window()
+        dialog = _get_dialog()
 
         # Check service status
         if window.getProperty(PROP_SERVICE_RUNNING) == 'starting':
-            dialog.ok(script_name, lang(32115) + '\n' + lang(32116))
+            dialog.ok(script_name, _msg(32115) + '\n' + _msg(32116))
             sys.exit()
 
         if not _check_service_running(window):
             log.warning("EasyTV service not running", event="service.missing")
-            if show_confirm(script_name, lang(32106) + '\n' + lang(32107)):
+            if show_confirm(script_name, _msg(32106) + '\n' + _msg(32107)):
                 restart_addon("script.easytv", ADDON_RESTART_DELAY_MS)
             sys.exit()
 
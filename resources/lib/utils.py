@@ -24,6 +24,7 @@ from __future__ import annotations
 
 import ast
 import datetime
+import functools
 import json
 import os
 import re
@@ -232,6 +233,17 @@ class StructuredLogger:
         """
         self.module = module_name
     
+    @property
+    def debug_enabled(self) -> bool:
+        """
+        Whether debug() output is currently written anywhere.
+        
+        debug() already returns early when disabled; check this first only
+        when building the debug kwargs is itself costly (e.g. counting
+        through a list).
+        """
+        return StructuredLogger._debug_enabled
+    
     @classmethod
     def initialize(cls, debug_enabled: bool, addon_id: str = DEFAULT_ADDON_ID) -> None:
         """
@@ -666,19 +678,20 @@ def log_timing(
         )
 
 
-def json_query(query: Union[Dict[str, Any], List[Dict[str, Any]]], return_result: bool = True) -> Dict[str, Any]:
+def json_query(query: Union[str, Dict[str, Any], List[Dict[str, Any]]], return_result: bool = True) -> Dict[str, Any]:
     """
     Execute a JSON-RPC query against Kodi.
     
     Args:
-        query: The JSON-RPC query dictionary.
+        query: The JSON-RPC query dictionary, or its already serialized
+            JSON text (see queries.serialized_query).
         return_result: If True, return only the 'result' key; otherwise return full response.
     
     Returns:
         The query result or empty dict on error.
     """
     try:
-        request = json.dumps(query)
+        request = query if isinstance(query, str) else json.dumps(query)
         response = xbmc.executeJSONRPC(request)
         # In Python 3, executeJSONRPC already returns a string
         data = json.loads(response)
@@ -690,6 +703,39 @@ def json_query(query: Union[Dict[str, Any], List[Dict[str, Any]]], return_result
         return {}
 
 
+def json_query_batch(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Execute a JSON-RPC batch request against Kodi in a single call.
+
+    Responses are matched to requests by id, so each request in the batch
+    must carry a unique id (see queries.build_jsonrpc_batch).
+
+    Args:
+        batch: List of JSON-RPC request dictionaries.
+
+    Returns:
+        The 'result' of each request, in request order. Requests that
+        failed or got no response yield an empty dict.
+    """
+    results: List[Dict[str, Any]] = [{} for _ in batch]
+    try:
+        response = json.loads(xbmc.executeJSONRPC(json.dumps(batch)))
+    except (json.JSONDecodeError, TypeError):
+        return results
+
+    if not isinstance(response, list):
+        return results
+
+    index_by_id = {call.get('id'): i for i, call in enumerate(batch)}
+    for item in response:
+        if not isinstance(item, dict):
+            continue
+        index = index_by_id.get(item.get('id'))
+        if index is not None:
+            results[index] = item.get('result') or {}
+    return results
+
+
 def runtime_converter(time_string: str) -> int:
     """
     Convert a runtime string to seconds.
@@ -945,15 +991,60 @@ def sanitize_filename(dirty_string: str) -> str:
     return sanitized
 
 
+def playlist_display_name(path: str) -> str:
+    """
+    Return the display name for a smart playlist path.
+    
+    Strips the directory and a trailing ``.xsp`` extension. Kodi's
+    Windows builds run Python 3.8, so ``str.removesuffix`` is not
+    available; the extension is dropped with a single slice instead.
+    
+    Args:
+        path: Full or special:// path to the playlist file.
+    
+    Returns:
+        The playlist filename without directory or ``.xsp`` suffix.
+    
+    Example:
+        playlist_display_name("special://profile/playlists/video/Kids.xsp")  # "Kids"
+    """
+    filename = os.path.basename(path)
+    return filename[:-4] if filename.endswith('.xsp') else filename
+
+
 # =============================================================================
 # Show Setting Parsing
 # =============================================================================
 
+def parse_stored_literal(raw_value: str) -> Any:
+    """Decode a list/dict value stored in a setting or window property.
+
+    Writers store JSON. Values saved by older versions used Python repr
+    (single-quoted dict keys), so fall back to ast.literal_eval when the
+    value is not valid JSON.
+
+    Args:
+        raw_value: The raw setting or property string.
+
+    Returns:
+        The decoded value.
+
+    Raises:
+        ValueError, SyntaxError: If the value is neither JSON nor a
+            Python literal.
+    """
+    try:
+        return json.loads(raw_value)
+    except (ValueError, TypeError):
+        return ast.literal_eval(raw_value)
+
+
 def _parse_show_setting(raw_value: str) -> Tuple[Dict[str, str], bool]:
     """Parse a show setting value, handling both old and new formats.
 
     Old format: "[367, 42]" - list of IDs
-    New format: "{'367': 'The Alienist', '42': 'Breaking Bad'}" - dict of ID to title
+    New format: '{"367": "The Alienist", "42": "Breaking Bad"}' - dict of ID to title
+    (versions before JSON storage wrote the same dict with Python repr quoting)
 
     Args:
         raw_value: The raw setting string from addon.getSetting()
@@ -968,7 +1059,7 @@ def _parse_show_setting(raw_value: str) -> Tuple[Dict[str, str], bool]:
         return {}, False
 
     try:
-        parsed = ast.literal_eval(raw_value)
+        parsed = parse_stored_literal(raw_value)
     except (ValueError, SyntaxError) as e:
         get_logger('settings').debug(
             "Failed to parse show setting",
@@ -1245,6 +1336,14 @@ def service_heartbeat() -> None:
         window.setProperty(PROP_SERVICE_RUNNING, 'polo')
 
 
+# Addons.SetAddonEnabled request; fill with the JSON-encoded addon ID and
+# 'true'/'false'. Kept pre-serialized since only these two fields vary.
+_SET_ADDON_ENABLED_RPC = (
+    '{"jsonrpc":"2.0","method":"Addons.SetAddonEnabled",'
+    '"id":1,"params":{"addonid":%s,"enabled":%s}}'
+)
+
+
 def restart_addon(addon_id: str, delay_ms: int = 500) -> None:
     """Disable and re-enable a Kodi addon to force a restart.
 
@@ -1252,20 +1351,10 @@ def restart_addon(addon_id: str, delay_ms: int = 500) -> None:
         addon_id: The addon ID to restart.
         delay_ms: Milliseconds to wait between disable and enable.
     """
-    import json as _json
-    xbmc.executeJSONRPC(_json.dumps({
-        "jsonrpc": "2.0",
-        "method": "Addons.SetAddonEnabled",
-        "id": 1,
-        "params": {"addonid": addon_id, "enabled": False}
-    }))
+    quoted_id = json.dumps(addon_id)
+    xbmc.executeJSONRPC(_SET_ADDON_ENABLED_RPC % (quoted_id, 'false'))
     xbmc.sleep(delay_ms)
-    xbmc.executeJSONRPC(_json.dumps({
-        "jsonrpc": "2.0",
-        "method": "Addons.SetAddonEnabled",
-        "id": 1,
-        "params": {"addonid": addon_id, "enabled": True}
-    }))
+    xbmc.executeJSONRPC(_SET_ADDON_ENABLED_RPC % (quoted_id, 'true'))
 
 
 def parse_lastplayed_date(date_string: str) -> float:
@@ -1335,12 +1424,15 @@ def busy_progress(message: str = "Loading...") -> Generator[None, None, None]:
 _VERSION_PATTERN = re.compile(r'^(\d+)\.(\d+)\.(\d+)(?:~(alpha|beta)(\d+))?$')
 
 
+@functools.lru_cache(maxsize=32)
 def parse_version(version_str: str) -> Tuple[int, int, int, int, int]:
     """
     Parse version string with prerelease support.
     
     Handles Kodi addon version format including optional ~alpha/~beta suffixes.
     Returns a 5-tuple suitable for comparison using Python's native tuple ordering.
+    Results are cached, as only a handful of distinct versions are ever seen
+    (this addon, the service, clones); invalid strings still raise every time.
     
     Args:
         version_str: Version string like "1.2.3", "1.2.3~beta1", "1.2.3~alpha2"
@@ -1365,11 +1457,7 @@ def parse_version(version_str: str) -> Tuple[int, int, int, int, int]:
     if not match:
         raise ValueError(f"Invalid version format: {version_str}")
     
-    major = int(match.group(1))
-    minor = int(match.group(2))
-    patch = int(match.group(3))
-    prerelease_tag = match.group(4)  # 'alpha', 'beta', or None
-    prerelease_num_str = match.group(5)  # digit string or None
+    major, minor, patch, prerelease_tag, prerelease_num_str = match.groups()
     
     if prerelease_tag is None:
         # Release version
@@ -1382,7 +1470,7 @@ def parse_version(version_str: str) -> Tuple[int, int, int, int, int]:
         prerelease_type = VERSION_PRERELEASE_BETA
         prerelease_num = int(prerelease_num_str)
     
-    return (major, minor, patch, prerelease_type, prerelease_num)
+    return (int(major), int(minor), int(patch), prerelease_type, prerelease_num)
 
 
 def compare_versions(v1: str, v2: str) -> int:
@@ -30,14 +30,13 @@ Logging:
         - playlist.save (INFO): Playlist selection saved successfully
 """
 
-import os
 from typing import Optional
 
 import xbmcaddon
 import xbmcgui
 
 from resources.lib.ui.dialogs import show_playlist_selection
-from resources.lib.utils import get_logger
+from resources.lib.utils import get_logger, playlist_display_name
 
 # Module logger
 log = get_logger('playlists')
@@ -80,9 +79,7 @@ def Main(playlist_type: Optional[str] = None) -> None:
             addon.setSetting(id=path_setting, value=pl)
 
             # Update display setting with filename only
-            filename = os.path.basename(pl)
-            if filename.endswith('.xsp'):
-                filename = filename[:-4]
+            filename = playlist_display_name(pl)
             addon.setSetting(id=display_setting, value=filename)
 
             # Also mirror to Advanced settings for tvshows playlists
@@ -41,7 +41,7 @@ Logging:
     Events: None (debug logging only)
 """
 
-import ast
+import json
 import sys
 
 import xbmc
@@ -50,7 +50,7 @@ import xbmcaddon
 from resources.lib.data.shows import generate_sort_key
 
 # Import shared utilities
-from resources.lib.utils import get_logger, json_query, lang
+from resources.lib.utils import get_logger, json_query, lang, parse_stored_literal
 
 __addon__ = xbmcaddon.Addon('script.easytv')
 __addonid__          = __addon__.getAddonInfo('id')
@@ -96,12 +96,12 @@ def _save_settings(selected_ids, all_shows_data):
     display_text = lang(32569) % count if count > 0 else lang(32571)
 
     if list_type == 'random_order_shows':
-        __addon__.setSetting(id="random_order_shows", value=str(selection_dict))
+        __addon__.setSetting(id="random_order_shows", value=json.dumps(selection_dict))
         __addon__.setSetting(id="random_order_shows_display", value=display_text)
         log.info("Random order shows saved", event="selector.save",
                  count=count, format="id_title_dict")
     else:
-        __addon__.setSetting(id="selection", value=str(selection_dict))
+        __addon__.setSetting(id="selection", value=json.dumps(selection_dict))
         __addon__.setSetting(id="selection_display", value=display_text)
         log.info("Selected shows saved", event="selector.save",
                  count=count, format="id_title_dict")
@@ -131,9 +131,11 @@ def Main():
 
         try:
             if list_type == 'random_order_shows':
-                raw_setting = ast.literal_eval(_setting_('random_order_shows'))
+                raw_value = _setting_('random_order_shows')
             else:
-                raw_setting = ast.literal_eval(_setting_('selection'))
+                raw_value = _setting_('selection')
+            # Empty (never saved) needs no parse; skip the failing decode
+            raw_setting = parse_stored_literal(raw_value) if raw_value else []
 
             # Handle both old [id] format and new {id: title} format
             if isinstance(raw_setting, dict):
@@ -57,11 +57,13 @@ Logging:
     Uses xbmc.log() directly (not StructuredLogger) due to import constraints.
 """
 
+import json
 import os
 import shutil
 import sys
 from typing import Optional
 from xml.etree import ElementTree as et
+from xml.sax.saxutils import escape
 
 import xbmc
 import xbmcaddon
@@ -70,6 +72,22 @@ import xbmcvfs
 
 # Constants (inlined to avoid import issues)
 ADDON_ENABLE_DELAY_MS = 1000
+ADDON_SCAN_POLL_BACKOFF_MS = (50, 100, 200, 400)
+ADDON_SCAN_TIMEOUT_MS = 3000
+ADDON_DETAILS_RPC = (
+    '{"jsonrpc":"2.0","method":"Addons.GetAddonDetails",'
+    '"id":1,"params":{"addonid":%s,"properties":["version"]}}'
+)
+IGNORE_NAMES = frozenset(('CVS', '.git', 'tmp', '.svn', '__pycache__'))
+IGNORE_SUFFIXES = ('.pyc', '.pyo')
+CLONE_SKIP_FILES = (
+    ('', frozenset(('service.py', 'addon.xml'))),
+    ('resources', frozenset(('settings.xml', 'clone.py'))),
+)
+SET_ADDON_ENABLED_RPC = (
+    '{"jsonrpc":"2.0","method":"Addons.SetAddonEnabled",'
+    '"id":1,"params":{"addonid":%s,"enabled":%s}}'
+)
 
 # Parse arguments
 src_path   = sys.argv[1]
@@ -92,6 +110,71 @@ def _lang(string_id):
     return __addon__.getLocalizedString(string_id)
 
 
+def _wait_for_addon_version(addon_id, version):
+    """Poll until Kodi reports addon_id at version, up to ADDON_SCAN_TIMEOUT_MS.
+
+    Mirrors clone._wait_for_addon, but the clone already exists here, so the
+    rescan is only done once Kodi reports the new version.
+    """
+    request = ADDON_DETAILS_RPC % json.dumps(addon_id)
+    waited = 0
+    step = 0
+    while waited < ADDON_SCAN_TIMEOUT_MS:
+        sleep_ms = min(ADDON_SCAN_POLL_BACKOFF_MS[min(step, len(ADDON_SCAN_POLL_BACKOFF_MS) - 1)],
+                       ADDON_SCAN_TIMEOUT_MS - waited)
+        xbmc.sleep(sleep_ms)
+        waited += sleep_ms
+        step += 1
+        try:
+            response = json.loads(xbmc.executeJSONRPC(request))
+        except ValueError:
+            continue
+        addon = response.get('result', {}).get('addon', {})
+        if addon.get('version') == version:
+            return True
+    return False
+
+
+def _copy_ignore(src, names):
+    """shutil.copytree ignore callback (mirrors clone._copy_ignore)."""
+    return [n for n in names if n in IGNORE_NAMES or n.endswith(IGNORE_SUFFIXES)]
+
+
+def _make_clone_ignore(root):
+    """copytree ignore callback for root (mirrors clone._make_clone_ignore).
+
+    Also skips the files a clone drops or replaces with its own template.
+    """
+    skip_by_dir = {
+        (os.path.join(root, sub) if sub else root): files
+        for sub, files in CLONE_SKIP_FILES
+    }
+
+    def ignore(src, names):
+        ignored = _copy_ignore(src, names)
+        skip = skip_by_dir.get(src)
+        if skip:
+            ignored.extend(n for n in names if n in skip)
+        return ignored
+    return ignore
+
+
+def _replace_in_file(filepath, replacements):
+    """Apply (old, new) string replacements to a UTF-8 file, in order.
+
+    Mirrors clone._replace_in_file: works on raw bytes and only rewrites
+    the file if a replacement changed it.
+    """
+    with open(filepath, 'rb') as f:
+        original = f.read()
+    content = original
+    for old, new in replacements:
+        content = content.replace(old.encode('utf-8'), new.encode('utf-8'))
+    if content != original:
+        with open(filepath, 'wb') as f:
+            f.write(content)
+
+
 def errorHandle(exception: Exception, trace: object, path_to_clean: Optional[str] = None) -> None:
     """Handle errors during update."""
     _log(f"Clone update failed: {exception}", xbmc.LOGERROR)
@@ -115,19 +198,13 @@ def Main():
         shutil.rmtree(new_path)
 
         progress.update(25, "Copying addon files...")
-        # Copy current addon to new location
-        IGNORE_PATTERNS = ('.pyc', 'CVS', '.git', 'tmp', '.svn', '__pycache__')
-        shutil.copytree(src_path, new_path, ignore=shutil.ignore_patterns(*IGNORE_PATTERNS))
+        # Copy current addon to new location (service.py, clone.py and the
+        # main addon.xml/settings.xml are skipped)
+        shutil.copytree(src_path, new_path, ignore=_make_clone_ignore(src_path))
 
         progress.update(35, "Configuring clone...")
-        # Remove unneeded files
         addon_file = os.path.join(new_path, 'addon.xml')
 
-        os.remove(os.path.join(new_path, 'service.py'))
-        os.remove(addon_file)
-        os.remove(os.path.join(new_path, 'resources', 'settings.xml'))
-        os.remove(os.path.join(new_path, 'resources', 'clone.py'))
-
         # Replace settings file and addon file with clone versions
         shutil.move(os.path.join(new_path, 'resources', 'addon_clone.xml'), addon_file)
         shutil.move(os.path.join(new_path, 'resources', 'settings_clone.xml'),
@@ -138,24 +215,22 @@ def Main():
         # This includes: section id, RunScript() calls for selector/playlist/exporter
         # Without this, settings actions would invoke the main addon instead of the clone
         settings_file = os.path.join(new_path, 'resources', 'settings.xml')
-        with open(settings_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        with open(settings_file, 'w', encoding='utf-8') as f:
-            f.write(content.replace('script.easytv', san_name))
+        _replace_in_file(settings_file, [('script.easytv', san_name)])
 
         progress.update(55, "Updating language files...")
         # Update strings.po header in ALL language folders to match clone addon id
         # Without this, Kodi 21+ won't load language strings for the clone
         language_dir = os.path.join(new_path, 'resources', 'language')
-        for lang_folder in os.listdir(language_dir):
-            strings_file = os.path.join(language_dir, lang_folder, 'strings.po')
-            if os.path.isfile(strings_file):
-                with open(strings_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                content = content.replace('# Addon Name: EasyTV', f'# Addon Name: {clone_name}')
-                content = content.replace('# Addon id: script.easytv', f'# Addon id: {san_name}')
-                with open(strings_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
+        # scandir's is_dir() comes from the directory listing, so stray files
+        # in language/ are skipped without a stat of their own
+        with os.scandir(language_dir) as entries:
+            for entry in entries:
+                strings_file = os.path.join(entry.path, 'strings.po')
+                if entry.is_dir() and os.path.isfile(strings_file):
+                    _replace_in_file(strings_file, [
+                        ('# Addon Name: EasyTV', f'# Addon Name: {clone_name}'),
+                        ('# Addon id: script.easytv', f'# Addon id: {san_name}'),
+                    ])
 
     except Exception as e:
         _, _, tb = sys.exc_info()
@@ -166,16 +241,31 @@ def Main():
     # Get parent version to use for clone
     parent_version = __addon__.getAddonInfo('version')
 
-    # Edit the addon.xml to set clone id, name, and version
-    tree = et.parse(addon_file)
-    root = tree.getroot()
-    root.set('id', san_name)
-    root.set('name', clone_name)
-    root.set('version', parent_version)
-    summary_elem = tree.find('.//summary')
-    if summary_elem is not None:
-        summary_elem.text = clone_name
-    tree.write(addon_file)
+    # Edit the addon.xml to set clone id, name, and version. The template
+    # placeholders are substituted as bytes (same as clone.py); fall back to
+    # ElementTree if the template no longer carries them.
+    with open(addon_file, 'rb') as f:
+        content = f.read()
+    placeholders = (b'script.easytv.SANNAME', b'CLONENAME', b'COMBNAME', b'version="1.0.0"')
+    if all(p in content for p in placeholders):
+        safe_name = escape(clone_name, {'"': '&quot;'}).encode('utf-8')
+        content = (content
+                   .replace(b'script.easytv.SANNAME', san_name.encode('utf-8'))
+                   .replace(b'CLONENAME', safe_name)
+                   .replace(b'COMBNAME', safe_name)
+                   .replace(b'version="1.0.0"', f'version="{parent_version}"'.encode('utf-8')))
+        with open(addon_file, 'wb') as f:
+            f.write(content)
+    else:
+        tree = et.parse(addon_file)
+        root = tree.getroot()
+        root.set('id', san_name)
+        root.set('name', clone_name)
+        root.set('version', parent_version)
+        summary_elem = tree.find('.//summary')
+        if summary_elem is not None:
+            summary_elem.text = clone_name
+        tree.write(addon_file)
 
     progress.update(75, "Updating scripts...")
     # Replace the addon id in Python files to avoid access violations
@@ -187,10 +277,7 @@ def Main():
     ]
 
     for py in py_files:
-        with open(py, 'r', encoding='utf-8') as f:
-            content = f.read()
-        with open(py, 'w', encoding='utf-8') as f:
-            f.write(content.replace('script.easytv', san_name))
+        _replace_in_file(py, [('script.easytv', san_name)])
 
     progress.update(85, "Updating skins...")
     # Update skin XML files to use clone's addon ID for language strings
@@ -207,10 +294,7 @@ def Main():
 
     for skin_file in skin_files:
         if os.path.isfile(skin_file):
-            with open(skin_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            with open(skin_file, 'w', encoding='utf-8') as f:
-                f.write(content.replace('$ADDON[script.easytv ', f'$ADDON[{san_name} '))
+            _replace_in_file(skin_file, [('$ADDON[script.easytv ', f'$ADDON[{san_name} ')])
 
     # Restore custom icon if one was set before the update
     custom_icon_path = xbmcvfs.translatePath(
@@ -225,19 +309,15 @@ def Main():
     try:
         progress.update(85, "Scanning for changes...")
         xbmc.executebuiltin('UpdateLocalAddons')
-        xbmc.sleep(3000)
+        if not _wait_for_addon_version(san_name, parent_version):
+            _log(f"Addon scan did not report {san_name} {parent_version} yet", xbmc.LOGWARNING)
 
         progress.update(92, "Registering with Kodi...")
         _log(f"Toggling addon registration: {san_name}")
-        xbmc.executeJSONRPC(
-            '{"jsonrpc":"2.0","method":"Addons.SetAddonEnabled",'
-            f'"id":1,"params":{{"addonid":"{san_name}","enabled":false}}}}'
-        )
+        quoted_name = json.dumps(san_name)
+        xbmc.executeJSONRPC(SET_ADDON_ENABLED_RPC % (quoted_name, 'false'))
         xbmc.sleep(ADDON_ENABLE_DELAY_MS)
-        xbmc.executeJSONRPC(
-            '{"jsonrpc":"2.0","method":"Addons.SetAddonEnabled",'
-            f'"id":1,"params":{{"addonid":"{san_name}","enabled":true}}}}'
-        )
+        xbmc.executeJSONRPC(SET_ADDON_ENABLED_RPC % (quoted_name, 'true'))
     except Exception:
         _log(f"Addon re-registration failed: {san_name}", xbmc.LOGWARNING)
 
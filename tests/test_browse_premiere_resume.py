@@ -137,3 +137,31 @@ class TestShouldIncludeResumeState:
         })
         should_include = _make_should_include(PREMIERE_SKIP, PREMIERE_SKIP)
         assert should_include([0, 318, '5996']) is False
+
+
+class TestReadEpisodeNumbers:
+    """Batch EpisodeNo read used by the browse premiere filter."""
+
+    def test_parses_season_and_episode(self, patch_window):
+        from resources.lib.playback.browse_mode import _read_episode_numbers
+        patch_window({
+            'EasyTV.318.EpisodeNo': 'S02E01',
+            'EasyTV.135.EpisodeNo': 's10e17',
+        })
+        assert _read_episode_numbers([318, 135]) == {318: (2, 1), 135: (10, 17)}
+
+    def test_missing_or_malformed_is_none(self, patch_window):
+        from resources.lib.playback.browse_mode import _read_episode_numbers
+        patch_window({
+            'EasyTV.2.EpisodeNo': 's01',
+            'EasyTV.3.EpisodeNo': 'sxxeyy',
+        })
+        assert _read_episode_numbers([1, 2, 3]) == {1: None, 2: None, 3: None}
+
+    def test_non_ascii_digits_are_malformed(self, patch_window):
+        from resources.lib.playback.browse_mode import _read_episode_numbers
+        patch_window({
+            'EasyTV.1.EpisodeNo': 's0²e01',
+            'EasyTV.2.EpisodeNo': 's 1e01',
+        })
+        assert _read_episode_numbers([1, 2]) == {1: None, 2: None}
@@ -0,0 +1,114 @@
+"""Tests for clone addon.xml generation in resources/clone.py."""
+import json
+import os
+import shutil
+from xml.etree import ElementTree as et
+
+from resources.clone import _fill_addon_xml
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+CLONE_TEMPLATE = os.path.join(REPO_ROOT, 'resources', 'addon_clone.xml')
+
+
+def _filled(tmp_path, name):
+    addon_file = str(tmp_path / 'addon.xml')
+    shutil.copy(CLONE_TEMPLATE, addon_file)
+    _fill_addon_xml(addon_file, 'script.easytv.kids', name, '4.1.0')
+    return et.parse(addon_file).getroot()
+
+
+def test_template_placeholders_filled(tmp_path):
+    root = _filled(tmp_path, 'Kids')
+    assert root.get('id') == 'script.easytv.kids'
+    assert root.get('name') == 'Kids'
+    assert root.get('version') == '4.1.0'
+    assert root.find('.//summary').text == 'Kids'
+
+
+def test_name_is_xml_escaped(tmp_path):
+    root = _filled(tmp_path, 'Tom & "Jerry" <2>')
+    assert root.get('name') == 'Tom & "Jerry" <2>'
+    assert root.find('.//summary').text == 'Tom & "Jerry" <2>'
+
+
+def test_falls_back_to_elementtree_without_placeholders(tmp_path):
+    addon_file = str(tmp_path / 'addon.xml')
+    with open(addon_file, 'w', encoding='utf-8') as f:
+        f.write('<addon id="x" name="y" version="0.1"><summary>z</summary></addon>')
+    _fill_addon_xml(addon_file, 'script.easytv.kids', 'Kids', '4.1.0')
+    root = et.parse(addon_file).getroot()
+    assert (root.get('id'), root.get('name'), root.get('version')) == (
+        'script.easytv.kids', 'Kids', '4.1.0')
+    assert root.find('.//summary').text == 'Kids'
+
+
+def test_replace_in_file_skips_unchanged_files(tmp_path, mocker):
+    from resources import clone
+    target = tmp_path / 'selector.py'
+    target.write_text('no addon id here\n', encoding='utf-8')
+    opened = mocker.patch('builtins.open', wraps=open)
+    clone._replace_in_file(str(target), [('script.easytv', 'script.easytv.kids')])
+    assert [c.args[1] for c in opened.call_args_list] == ['rb']
+
+
+def test_replace_in_file_applies_replacements_in_order(tmp_path):
+    from resources import clone
+    target = tmp_path / 'strings.po'
+    target.write_text('# Addon id: script.easytv\n', encoding='utf-8')
+    clone._replace_in_file(str(target), [
+        ('script.easytv', 'script.easytv.kids'),
+        ('kids', 'night'),
+    ])
+    assert target.read_text(encoding='utf-8') == '# Addon id: script.easytv.night\n'
+
+
+def test_copy_ignore_skips_vcs_dirs_and_bytecode():
+    from resources.clone import _copy_ignore
+    names = ['.git', '__pycache__', 'tmp', 'main.pyc', 'main.py', 'icon.png', 'tmp.xml']
+    assert _copy_ignore('/src', names) == ['.git', '__pycache__', 'tmp', 'main.pyc']
+
+
+def test_replace_in_file_keeps_line_endings_and_non_ascii(tmp_path):
+    from resources import clone
+    target = tmp_path / 'strings.po'
+    target.write_bytes('# Addon Name: EasyTV\r\nmsgid "Caf\u00e9"\r\n'.encode('utf-8'))
+    clone._replace_in_file(str(target), [('# Addon Name: EasyTV', '# Addon Name: Kinder\u00e4')])
+    assert target.read_bytes() == '# Addon Name: Kinder\u00e4\r\nmsgid "Caf\u00e9"\r\n'.encode('utf-8')
+
+
+def test_wait_for_addon_returns_once_addon_is_listed(mocker):
+    from resources import clone
+    sleep = mocker.patch.object(clone.xbmc, 'sleep')
+    rpc = mocker.patch.object(clone.xbmc, 'executeJSONRPC',
+                              side_effect=['{"result": {}}', '{"result": {"addon": {"addonid": "x"}}}'])
+    assert clone._wait_for_addon('script.easytv.kids') is True
+    assert [c.args[0] for c in sleep.call_args_list] == [50, 100]
+    assert json.loads(rpc.call_args[0][0])['params'] == {'addonid': 'script.easytv.kids'}
+
+
+def test_wait_for_addon_gives_up_at_timeout(mocker):
+    from resources import clone
+    sleep = mocker.patch.object(clone.xbmc, 'sleep')
+    mocker.patch.object(clone.xbmc, 'executeJSONRPC', return_value='{"result": {}}')
+    assert clone._wait_for_addon('script.easytv.kids') is False
+    assert sum(c.args[0] for c in sleep.call_args_list) == clone.ADDON_SCAN_TIMEOUT_MS
+
+
+def test_clone_copy_skips_replaced_files(tmp_path):
+    from resources.clone import _make_clone_ignore
+    src = tmp_path / 'script.easytv'
+    (src / 'resources' / 'lib').mkdir(parents=True)
+    for rel in ('addon.xml', 'service.py', 'default.py',
+                'resources/settings.xml', 'resources/clone.py',
+                'resources/addon_clone.xml', 'resources/lib/settings.xml'):
+        (src / rel).write_text('x', encoding='utf-8')
+    dst = tmp_path / 'copy'
+    shutil.copytree(str(src), str(dst), ignore=_make_clone_ignore(str(src)))
+    copied = sorted(p.relative_to(dst).as_posix() for p in dst.rglob('*') if p.is_file())
+    # Only the top-level files are skipped; same names deeper down are kept
+    assert copied == ['default.py', 'resources/addon_clone.xml', 'resources/lib/settings.xml']
+
+
+def test_fill_addon_xml_keeps_non_ascii_name(tmp_path):
+    root = _filled(tmp_path, 'Kinderträume')
+    assert root.get('name') == 'Kinderträume'
@@ -72,6 +72,14 @@ class TestPlaylistFilenames:
         tvshow_names = PLAYLIST_CONFIG.all_tvshow_filenames()
         assert all_names == episode_names + tvshow_names
 
+    def test_filenames_are_computed_once(self):
+        assert PLAYLIST_CONFIG.all_filenames() is PLAYLIST_CONFIG.all_filenames()
+        assert isinstance(PLAYLIST_CONFIG.all_filenames(), tuple)
+
+    def test_filenames_follow_category_order(self):
+        assert PLAYLIST_CONFIG.all_episode_filenames()[0] == PLAYLIST_CONFIG.episode.all_shows.filename
+        assert PLAYLIST_CONFIG.all_tvshow_filenames()[-1] == PLAYLIST_CONFIG.tvshow.season_premieres.filename
+
     def test_filenames_end_with_xsp(self):
         for fn in PLAYLIST_CONFIG.all_filenames():
             assert fn.endswith(".xsp"), f"{fn} doesn't end with .xsp"
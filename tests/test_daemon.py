@@ -127,3 +127,19 @@ class TestProducerDropAndDelete:
 
         remove.assert_any_call(11)
         storage.db.delete_show_tracking.assert_not_called()
+
+
+class TestTrackedShowsProperty:
+    """The tracked-shows window property is published as JSON."""
+
+    def test_remove_publishes_json_list(self, mocker, make_daemon):
+        import json
+
+        from resources.lib.constants import PROP_SHOWS_WITH_NEXT_EPISODES
+        d = make_daemon(tracked=[11, 12], random_order=[])
+        mocker.patch.object(d, "_update_smartplaylist")
+
+        d._remove_from_shows_with_next_episodes(11)
+
+        d._window.setProperty.assert_called_once_with(PROP_SHOWS_WITH_NEXT_EPISODES, "[12]")
+        assert json.loads(d._window.setProperty.call_args[0][1]) == [12]
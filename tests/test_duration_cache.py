@@ -114,3 +114,74 @@ class TestBuildUpdatedCache:
         old = self._cache({'100': {'median_seconds': 2000, 'episode_count': 10, 'title': 'Old Name'}})
         result = build_updated_cache(old, {100: 10}, {}, {100: 'New Name'})
         assert result['shows']['100']['title'] == 'New Name'
+        assert old['shows']['100']['title'] == 'Old Name'
+
+    def test_unchanged_entry_is_shared_not_copied(self):
+        entry = {'median_seconds': 2000, 'episode_count': 10, 'title': 'A'}
+        result = build_updated_cache(self._cache({'100': entry}), {100: 10}, {}, {100: 'A'})
+        assert result['shows']['100'] is entry
+
+    def test_missing_title_filled_without_touching_old(self):
+        old = self._cache({'100': {'median_seconds': 2000, 'episode_count': 10}})
+        result = build_updated_cache(old, {100: 10}, {})
+        assert result['shows']['100']['title'] == ''
+        assert 'title' not in old['shows']['100']
+
+
+# ── save_duration_cache ──────────────────────────────────────────────
+
+class TestSaveDurationCache:
+    def test_writes_compact_json_and_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        import json
+
+        from resources.lib.data import duration_cache
+        path = tmp_path / 'duration_cache.json'
+        monkeypatch.setattr(duration_cache, '_cache_file_path', str(path))
+        cache = {'shows': {'1': {'title': 'Café', 'median_seconds': 1500}}}
+        assert duration_cache.save_duration_cache(cache) is True
+        text = path.read_text(encoding='utf-8')
+        assert json.loads(text)['shows']['1']['title'] == 'Café'
+        assert '\n' not in text
+        assert not (tmp_path / 'duration_cache.json.tmp').exists()
+
+    def test_failed_save_keeps_previous_file(self, tmp_path, monkeypatch):
+        from resources.lib.data import duration_cache
+        path = tmp_path / 'duration_cache.json'
+        path.write_text('{"version": 1, "shows": {}}', encoding='utf-8')
+        monkeypatch.setattr(duration_cache, '_cache_file_path', str(path))
+        assert duration_cache.save_duration_cache({'shows': {'1': object()}}) is False
+        assert path.read_text(encoding='utf-8') == '{"version": 1, "shows": {}}'
+        assert not (tmp_path / 'duration_cache.json.tmp').exists()
+
+
+# ── load_duration_cache ──────────────────────────────────────────────
+
+class TestLoadDurationCacheMemo:
+    def _setup(self, tmp_path, monkeypatch):
+        from resources.lib.data import duration_cache
+        path = tmp_path / 'duration_cache.json'
+        monkeypatch.setattr(duration_cache, '_cache_file_path', str(path))
+        monkeypatch.setattr(duration_cache, '_loaded_cache', None)
+        return duration_cache, path
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path, monkeypatch):
+        duration_cache, path = self._setup(tmp_path, monkeypatch)
+        path.write_text('{"version": %d, "shows": {"1": {}}}' % DURATION_CACHE_VERSION,
+                        encoding='utf-8')
+        first = duration_cache.load_duration_cache()
+        assert duration_cache.load_duration_cache() is first
+
+    def test_save_invalidates(self, tmp_path, monkeypatch):
+        duration_cache, path = self._setup(tmp_path, monkeypatch)
+        path.write_text('{"version": %d, "shows": {}}' % DURATION_CACHE_VERSION,
+                        encoding='utf-8')
+        first = duration_cache.load_duration_cache()
+        duration_cache.save_duration_cache({'shows': {'7': {'median_seconds': 60}}})
+        second = duration_cache.load_duration_cache()
+        assert second is not first
+        assert '7' in second['shows']
+
+    def test_missing_file_returns_empty_cache(self, tmp_path, monkeypatch):
+        duration_cache, _ = self._setup(tmp_path, monkeypatch)
+        assert duration_cache.load_duration_cache() == {
+            'version': DURATION_CACHE_VERSION, 'shows': {}}
@@ -6,12 +6,19 @@ from resources.lib.constants import (
 )
 from resources.lib.data.queries import (
     FILTER_UNWATCHED,
+    build_add_items_batch_query,
     build_episode_details_query,
+    build_episode_resume_query,
+    build_jsonrpc_batch,
+    build_multi_show_streamdetails_batch,
     build_player_seek_time_query,
     build_random_episodes_query,
     build_random_movies_query,
     build_show_episodes_query,
+    build_shows_art_query,
+    get_all_shows_query,
     get_episode_filter,
+    serialized_query,
 )
 
 # ── get_episode_filter ──────────────────────────────────────────────
@@ -31,11 +38,8 @@ class TestGetEpisodeFilter:
     def test_unknown_mode_returns_none(self):
         assert get_episode_filter(999) is None
 
-    def test_returns_copy_not_original(self):
-        f = get_episode_filter(EPISODE_SELECTION_UNWATCHED)
-        assert f is not FILTER_UNWATCHED
-        f['extra'] = 'x'
-        assert 'extra' not in FILTER_UNWATCHED
+    def test_returns_shared_constant(self):
+        assert get_episode_filter(EPISODE_SELECTION_UNWATCHED) is FILTER_UNWATCHED
 
 
 # ── build_random_episodes_query ──────────────────────────────────────
@@ -139,3 +143,67 @@ class TestBuildEpisodeDetailsQuery:
         q1 = build_episode_details_query(episode_id=1)
         q2 = build_episode_details_query(episode_id=1)
         assert q1 is not q2
+
+    def test_full_property_set_by_default(self):
+        props = build_episode_details_query(episode_id=1)['params']['properties']
+        assert 'art' in props and 'streamdetails' in props
+
+    def test_fields_restrict_properties(self):
+        q = build_episode_details_query(episode_id=1, fields=('season', 'episode'))
+        assert q['params']['properties'] == ('season', 'episode')
+
+
+# ── build_episode_resume_query ───────────────────────────────────────
+
+class TestBuildEpisodeResumeQuery:
+    def test_requests_resume_only(self):
+        q = build_episode_resume_query(episode_id=456)
+        assert q['method'] == 'VideoLibrary.GetEpisodeDetails'
+        assert q['params'] == {'episodeid': 456, 'properties': ('resume',)}
+
+
+# ── build_jsonrpc_batch ──────────────────────────────────────────────
+
+class TestBuildJsonrpcBatch:
+    def test_assigns_unique_ids_in_order(self):
+        batch = build_jsonrpc_batch([get_all_shows_query(), build_shows_art_query()])
+        assert [c['id'] for c in batch] == [1, 2]
+        assert batch[1]['params'] == {'properties': ('art',)}
+
+    def test_does_not_mutate_input(self):
+        calls = [get_all_shows_query(), get_all_shows_query()]
+        build_jsonrpc_batch(calls)
+        assert [c['id'] for c in calls] == [1, 1]
+
+
+# ── serialized_query ─────────────────────────────────────────────────
+
+class TestSerializedQuery:
+    def test_matches_builder_output(self):
+        import json
+        assert serialized_query(get_all_shows_query) == json.dumps(get_all_shows_query())
+
+    def test_serialized_once_per_builder(self):
+        assert serialized_query(get_all_shows_query) is serialized_query(get_all_shows_query)
+
+
+# ── build_add_items_batch_query ──────────────────────────────────────
+
+class TestBuildAddItemsBatchQuery:
+    def test_adds_in_order_with_unique_ids(self):
+        batch = build_add_items_batch_query([('episode', 7), ('movie', 3), ('episode', 9)])
+        assert [c['method'] for c in batch] == ['Playlist.Add'] * 3
+        assert [c['params']['item'] for c in batch] == [
+            {'episodeid': 7}, {'movieid': 3}, {'episodeid': 9},
+        ]
+        assert [c['id'] for c in batch] == [1, 2, 3]
+
+
+# ── build_multi_show_streamdetails_batch ─────────────────────────────
+
+class TestBuildMultiShowStreamdetailsBatch:
+    def test_one_call_per_show_in_order(self):
+        batch = build_multi_show_streamdetails_batch([11, 12])
+        assert [c['params']['tvshowid'] for c in batch] == [11, 12]
+        assert [c['id'] for c in batch] == [1, 2]
+        assert batch[0]['params']['properties'] == ('tvshowid', 'streamdetails')
@@ -1,5 +1,7 @@
-"""Tests for _parse_show_setting (now in resources/lib/utils.py)."""
-from resources.lib.utils import _parse_show_setting
+"""Tests for _parse_show_setting and parse_stored_literal (resources/lib/utils.py)."""
+import json
+
+from resources.lib.utils import _parse_show_setting, parse_stored_literal
 
 
 class TestParseShowSetting:
@@ -49,3 +51,17 @@ class TestParseShowSetting:
         )
         assert len(result) == 3
         assert needs_migration is False
+
+    def test_json_dict_format(self):
+        result, needs_migration = _parse_show_setting('{"367": "The Alienist"}')
+        assert result == {"367": "The Alienist"}
+        assert needs_migration is False
+
+
+class TestParseStoredLiteral:
+    def test_json_round_trip(self):
+        value = {"367": "Show 'A'", "42": "Café"}
+        assert parse_stored_literal(json.dumps(value)) == value
+
+    def test_legacy_repr_fallback(self):
+        assert parse_stored_literal("{'367': 'The Alienist'}") == {"367": "The Alienist"}
@@ -59,3 +59,159 @@ def test_get_skin_setting_importable():
     """Verify _get_skin_setting is importable."""
     from resources.lib.ui.main import _get_skin_setting
     assert callable(_get_skin_setting)
+
+
+def test_check_service_running_detects_polo_with_backoff():
+    from resources.lib.ui import main
+    window = MagicMock()
+    window.getProperty.side_effect = ['marco', 'marco', 'polo']
+    with patch.object(main.xbmc, 'sleep') as sleep:
+        assert main._check_service_running(window) is True
+    window.setProperty.assert_called_once_with('EasyTV_service_running', 'marco')
+    assert [c.args[0] for c in sleep.call_args_list] == [1, 2]
+
+
+def test_check_service_running_times_out():
+    from resources.lib.constants import SERVICE_POLL_TIMEOUT_MS
+    from resources.lib.ui import main
+    window = MagicMock()
+    window.getProperty.return_value = 'marco'
+    with patch.object(main.xbmc, 'sleep') as sleep:
+        assert main._check_service_running(window) is False
+    assert sum(c.args[0] for c in sleep.call_args_list) >= SERVICE_POLL_TIMEOUT_MS
+
+
+def test_snapshot_settings_reads_each_key_once():
+    from resources.lib.ui import main
+    addon = MagicMock()
+    addon.getSetting.side_effect = {'a': 'true', 'b': '3.0', 'c': 'x'}.get
+    settings = main._snapshot_settings(addon, ('a', 'b'))
+    main._snapshot_settings(addon, ('c',), into=settings)
+    assert settings == {'a': 'true', 'b': '3.0', 'c': 'x'}
+    assert addon.getSetting.call_count == 3
+    assert main._as_bool(settings, 'a') is True
+    assert main._as_int(settings, 'b') == 3
+    assert main._as_int(settings, 'c') == 0
+
+
+def test_reopen_settings_uses_own_addon_id():
+    from resources.lib.ui import main
+    with patch.object(main.xbmc, 'executebuiltin') as builtin:
+        main._reopen_settings('script.easytv.clone1')
+    assert [c.args[0] for c in builtin.call_args_list] == [
+        'Dialog.Close(all,true)',
+        'AlarmClock(EasyTVSettings,Addon.OpenSettings(script.easytv.clone1),00:01,silent)',
+    ]
+
+
+def test_get_skin_setting_migrates_legacy_values():
+    from resources.lib.ui import main
+    for legacy, expected in (('true', 1), ('false', 0), ('32073', 0)):
+        addon = MagicMock()
+        addon.getSetting.return_value = legacy
+        assert main._get_skin_setting(addon) == expected
+        addon.setSetting.assert_called_once_with('view_style', '1')
+
+
+def test_get_skin_setting_current_values_not_rewritten():
+    from resources.lib.ui import main
+    addon = MagicMock()
+    addon.getSetting.return_value = '2'
+    assert main._get_skin_setting(addon) == 2
+    addon.getSetting.return_value = ''
+    assert main._get_skin_setting(addon) == 0
+    addon.setSetting.assert_not_called()
+
+
+def test_get_skin_setting_uses_snapshot_value():
+    from resources.lib.ui import main
+    addon = MagicMock()
+    assert main._get_skin_setting(addon, '2') == 2
+    addon.getSetting.assert_not_called()
+
+
+def test_require_playlist_exits_with_dialog_when_missing():
+    import pytest
+
+    from resources.lib.ui import main
+    dialog = MagicMock()
+    with patch.object(main.xbmcvfs, 'exists', return_value=False), \
+            patch.object(main, '_msg', return_value='Missing'):
+        with pytest.raises(SystemExit):
+            main._require_playlist('/p/gone.xsp', 32606,
+                                   "Movie playlist file not found",
+                                   dialog, MagicMock(), 'EasyTV')
+    dialog.ok.assert_called_once_with('EasyTV', 'Missing')
+
+
+def test_require_playlist_passes_when_present():
+    from resources.lib.ui import main
+    dialog = MagicMock()
+    with patch.object(main.xbmcvfs, 'exists', return_value=True):
+        main._require_playlist('/p/shows.xsp', 32607,
+                               "TV show playlist file not found",
+                               dialog, MagicMock(), 'EasyTV')
+    dialog.ok.assert_not_called()
+
+
+def test_msg_fetches_each_string_once():
+    from resources.lib.ui import main
+    with patch.dict(main._msgs, clear=True), \
+            patch.object(main, 'lang', return_value='Hello') as lang:
+        assert main._msg(32108) == 'Hello'
+        assert main._msg(32108) == 'Hello'
+    lang.assert_called_once_with(32108)
+
+
+def test_outdated_clone_launches_update_script():
+    from resources.lib.ui import main
+    window = MagicMock()
+    window.getProperty.side_effect = {
+        'EasyTV.Version': '2.0.0', 'EasyTV.ServicePath': '/svc',
+    }.get
+    with patch.object(main, 'show_confirm', return_value=True), \
+            patch.object(main, '_msg', return_value=''), \
+            patch.object(main.xbmc, 'executebuiltin') as builtin:
+        ok = main._handle_version_mismatch(
+            (1, 0, 0, 2, 0), '1.0.0', 'script.easytv.kids', '/kids', 'Kids',
+            window, MagicMock(), MagicMock())
+    assert ok is False
+    update_script = main.os.path.join('/svc', 'resources', 'update_clone.py')
+    builtin.assert_called_once_with(
+        'RunScript(%s,/svc,/kids,script.easytv.kids,Kids)' % update_script)
+
+
+def test_version_check_skips_parse_when_strings_match():
+    from resources.lib.ui import main
+    window = MagicMock()
+    window.getProperty.return_value = '4.1.0'
+    with patch.object(main, 'parse_version') as parse:
+        assert main._handle_version_mismatch(
+            (4, 1, 0, 2, 0), '4.1.0', 'script.easytv.kids', '/kids', 'Kids',
+            window, MagicMock(), MagicMock()) is True
+    parse.assert_not_called()
+
+
+def test_config_specs_match_dataclasses_and_snapshot_keys():
+    from dataclasses import fields
+
+    from resources.lib.playback.browse_mode import EpisodeListConfig
+    from resources.lib.playback.random_player import RandomPlaylistConfig
+    from resources.lib.ui import main
+    for spec, config_cls, branch_keys in (
+        (main._RANDOM_CONFIG_SPEC, RandomPlaylistConfig, main._RANDOM_SETTING_KEYS),
+        (main._BROWSE_CONFIG_SPEC, EpisodeListConfig, main._BROWSE_SETTING_KEYS),
+    ):
+        names = {f.name for f in fields(config_cls)}
+        snapshot = set(main._COMMON_SETTING_KEYS) | set(branch_keys)
+        for field, key, _ in spec:
+            assert field in names
+            assert key in snapshot
+
+
+def test_config_kwargs_parses_snapshot():
+    from resources.lib.ui import main
+    settings = {'limit_shows': 'true', 'window_length': '15.0'}
+    spec = (('limit_shows', 'limit_shows', main._as_bool),
+            ('window_length', 'window_length', main._as_int))
+    assert main._config_kwargs(settings, spec) == {'limit_shows': True, 'window_length': 15}
@@ -24,31 +24,27 @@ class _FakeWindow:
     def getProperty(self, k): return self._p.get(k, '')
 
 
-def test_main_addon_reads_window_property(monkeypatch):
-    monkeypatch.setattr('resources.lib.ui.main.xbmcgui.Window',
-                        lambda _id: _FakeWindow({"EasyTV.selection": "[1, 2, 3]"}))
-    assert sorted(_read_selected_shows(_addon('script.easytv'))) == [1, 2, 3]
+def test_main_addon_reads_window_property():
+    window = _FakeWindow({"EasyTV.selection": "[1, 2, 3]"})
+    assert sorted(_read_selected_shows(_addon('script.easytv'), window)) == [1, 2, 3]
 
 
-def test_clone_reads_its_own_setting_not_window_property(monkeypatch):
-    monkeypatch.setattr('resources.lib.ui.main.xbmcgui.Window',
-                        lambda _id: _FakeWindow({"EasyTV.selection": "[1, 2, 3]"}))
+def test_clone_reads_its_own_setting_not_window_property():
+    window = _FakeWindow({"EasyTV.selection": "[1, 2, 3]"})
     addon = _addon('script.easytv.kids', {'selection': "{'9': 'Bluey'}"})
-    assert _read_selected_shows(addon) == [9]   # own setting, NOT the window's [1,2,3]
+    assert _read_selected_shows(addon, window) == [9]   # own setting, NOT the window's [1,2,3]
 
 
 def test_clone_empty_selection_is_empty_list():
     assert _read_selected_shows(_addon('script.easytv.kids', {'selection': "none"})) == []
 
 
-def test_clone_reads_its_own_random_order_setting(monkeypatch):
-    monkeypatch.setattr('resources.lib.ui.main.xbmcgui.Window',
-                        lambda _id: _FakeWindow({"EasyTV.random_order_shows": "[1, 2]"}))
+def test_clone_reads_its_own_random_order_setting():
+    window = _FakeWindow({"EasyTV.random_order_shows": "[1, 2]"})
     addon = _addon('script.easytv.kids', {'random_order_shows': "{'9': 'Bluey'}"})
-    assert _read_random_order_shows(addon) == [9]   # own setting, not window [1,2]
+    assert _read_random_order_shows(addon, window) == [9]   # own setting, not window [1,2]
 
 
-def test_main_addon_random_order_from_window_property(monkeypatch):
-    monkeypatch.setattr('resources.lib.ui.main.xbmcgui.Window',
-                        lambda _id: _FakeWindow({"EasyTV.random_order_shows": "[1, 2]"}))
-    assert sorted(_read_random_order_shows(_addon('script.easytv'))) == [1, 2]
+def test_main_addon_random_order_from_window_property():
+    window = _FakeWindow({"EasyTV.random_order_shows": "[1, 2]"})
+    assert sorted(_read_random_order_shows(_addon('script.easytv'), window)) == [1, 2]
@@ -9,6 +9,7 @@ from resources.lib.utils import (
     parse_lastplayed_date,
     parse_show_id_list,
     parse_version,
+    playlist_display_name,
     runtime_converter,
     sanitize_filename,
 )
@@ -44,6 +45,17 @@ class TestParseVersion:
         a2 = parse_version("1.0.0~alpha2")
         assert a1 < a2
 
+    def test_repeat_calls_hit_cache(self):
+        parse_version.cache_clear()
+        parse_version("3.1.4")
+        parse_version("3.1.4")
+        assert parse_version.cache_info().hits == 1
+
+    def test_invalid_still_raises_when_repeated(self):
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                parse_version("not-a-version")
+
 
 # ── compare_versions ─────────────────────────────────────────────────
 
@@ -93,6 +105,22 @@ class TestSanitizeFilename:
         assert sanitize_filename("  test  ") == "test"
 
 
+# ── playlist_display_name ────────────────────────────────────────────
+
+class TestPlaylistDisplayName:
+    def test_strips_directory_and_extension(self):
+        assert playlist_display_name("special://profile/playlists/video/Kids.xsp") == "Kids"
+
+    def test_keeps_other_extensions(self):
+        assert playlist_display_name("/tmp/Kids.m3u") == "Kids.m3u"
+
+    def test_only_trailing_suffix_removed(self):
+        assert playlist_display_name("a.xsp.bak") == "a.xsp.bak"
+
+    def test_empty_input(self):
+        assert playlist_display_name("") == ""
+
+
 # ── runtime_converter ────────────────────────────────────────────────
 
 class TestRuntimeConverter:
@@ -277,3 +305,79 @@ class TestParseShowIdList:
 
     def test_malformed(self):
         assert parse_show_id_list("{not valid") == []
+
+
+# ── restart_addon ────────────────────────────────────────────────────
+
+class TestRestartAddon:
+    def test_disables_then_enables_with_valid_json(self, mocker):
+        import json
+
+        from resources.lib import utils
+        rpc = mocker.patch.object(utils.xbmc, 'executeJSONRPC')
+        sleep = mocker.patch.object(utils.xbmc, 'sleep')
+        utils.restart_addon('script.easytv', 250)
+        payloads = [json.loads(c.args[0]) for c in rpc.call_args_list]
+        assert [p['params'] for p in payloads] == [
+            {'addonid': 'script.easytv', 'enabled': False},
+            {'addonid': 'script.easytv', 'enabled': True},
+        ]
+        assert payloads[0]['method'] == 'Addons.SetAddonEnabled'
+        sleep.assert_called_once_with(250)
+
+
+# ── StructuredLogger.debug_enabled ───────────────────────────────────
+
+class TestDebugEnabled:
+    def test_follows_class_flag(self, monkeypatch):
+        from resources.lib.utils import StructuredLogger
+        log = StructuredLogger('test')
+        monkeypatch.setattr(StructuredLogger, '_debug_enabled', False)
+        assert log.debug_enabled is False
+        monkeypatch.setattr(StructuredLogger, '_debug_enabled', True)
+        assert log.debug_enabled is True
+
+
+# ── json_query_batch ─────────────────────────────────────────────────
+
+class TestJsonQueryBatch:
+    def test_results_returned_in_request_order(self, mocker):
+        import json
+
+        from resources.lib import utils
+        rpc = mocker.patch.object(utils.xbmc, 'executeJSONRPC', return_value=json.dumps([
+            {'jsonrpc': '2.0', 'id': 2, 'result': {'b': 2}},
+            {'jsonrpc': '2.0', 'id': 1, 'result': {'a': 1}},
+        ]))
+        batch = [{'id': 1, 'method': 'A'}, {'id': 2, 'method': 'B'}]
+        assert utils.json_query_batch(batch) == [{'a': 1}, {'b': 2}]
+        rpc.assert_called_once()
+        assert json.loads(rpc.call_args.args[0]) == batch
+
+    def test_error_entry_yields_empty_dict(self, mocker):
+        import json
+
+        from resources.lib import utils
+        mocker.patch.object(utils.xbmc, 'executeJSONRPC', return_value=json.dumps([
+            {'jsonrpc': '2.0', 'id': 1, 'result': {'a': 1}},
+            {'jsonrpc': '2.0', 'id': 2, 'error': {'code': -32601}},
+        ]))
+        assert utils.json_query_batch([{'id': 1}, {'id': 2}]) == [{'a': 1}, {}]
+
+    def test_invalid_response_yields_empty_dicts(self, mocker):
+        from resources.lib import utils
+        mocker.patch.object(utils.xbmc, 'executeJSONRPC', return_value='not json')
+        assert utils.json_query_batch([{'id': 1}, {'id': 2}]) == [{}, {}]
+
+
+# ── json_query ───────────────────────────────────────────────────────
+
+class TestJsonQuery:
+    def test_serialized_query_sent_unchanged(self, mocker):
+        from resources.lib import utils
+        request = '{"jsonrpc": "2.0", "id": 1, "method": "A"}'
+        rpc = mocker.patch.object(
+            utils.xbmc, 'executeJSONRPC', return_value='{"id": 1, "result": {"a": 1}}'
+        )
+        assert utils.json_query(request) == {'a': 1}
+        rpc.assert_called_once_with(request)